@@ -0,0 +1,84 @@
+"""
+Guards the startup cost of yaybot.
+
+Runs `import yaybot` and `Yay()` in fresh interpreters, prints how long each
+took and fails if a heavy dependency is imported by `import yaybot` again.
+
+    python benchmarks/import_time.py [--budget SECONDS]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+
+# imported on first use only, never by `import yaybot`
+HEAVY_MODULES = (
+    'requests',
+    'bs4',
+    'tqdm',
+    'huepy',
+    'numpy',
+    'fake_useragent',
+    'zstandard',
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = """
+import sys, time
+started = time.perf_counter()
+import yaybot
+elapsed = time.perf_counter() - started
+print(elapsed)
+print(','.join(m for m in {modules!r} if m in sys.modules))
+"""
+
+INIT_SNIPPET = """
+import time
+from yaybot import Yay
+started = time.perf_counter()
+Yay(credentials=False).close()
+print(time.perf_counter() - started)
+"""
+
+
+def run(snippet):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    out = subprocess.run(
+        [sys.executable, '-c', snippet], env=env, cwd=ROOT,
+        capture_output=True, text=True, check=True)
+    return out.stdout.splitlines()
+
+
+def best_of(snippet, repeat):
+    # the fastest run is the least disturbed by the rest of the machine
+    return min(float(run(snippet)[0]) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget', type=float, default=None,
+                        help='fail if `import yaybot` takes longer (seconds)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    snippet = IMPORT_SNIPPET.format(modules=HEAVY_MODULES)
+    loaded = [module for module in run(snippet)[1].split(',') if module]
+
+    import_time = best_of(snippet, args.repeat)
+    print(f'import yaybot: {import_time * 1000:.0f}ms')
+    print(f'Yay():         {best_of(INIT_SNIPPET, args.repeat) * 1000:.0f}ms')
+
+    failed = False
+    if loaded:
+        print(f'FAIL: `import yaybot` imported {", ".join(loaded)}')
+        failed = True
+    if args.budget is not None and import_time > args.budget:
+        print(f'FAIL: `import yaybot` took longer than {args.budget * 1000:.0f}ms')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Measures the memory held by User objects with tracemalloc.
+
+Compares the __slots__ User with an equivalent object that keeps its
+attributes in a per-instance __dict__, as the models did before __slots__.
+
+    python benchmarks/model_memory.py [--count N]
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from payloads import payloads
+
+from yaybot import utils
+
+
+class DictUser(object):
+    # same attributes as User, stored in __dict__
+    pass
+
+
+def to_dict_user(data):
+    user = utils.to_user(data)
+    obj = DictUser()
+    for attr, _ in utils.USER_FIELDS:
+        setattr(obj, attr, getattr(user, attr))
+    return obj
+
+
+def measure(convert, items):
+    gc.collect()
+    tracemalloc.start()
+    objs = [convert(data) for data in items]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objs
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    # the payloads are allocated before tracing starts, only the objects count
+    items = payloads('user', args.count)
+    with_dict = measure(to_dict_user, items)
+    with_slots = measure(utils.to_user, items)
+    print(f'{args.count} users')
+    print(f'__dict__:  {with_dict / 2 ** 20:6.1f} MB ({with_dict / args.count:.0f} bytes each)')
+    print(f'__slots__: {with_slots / 2 ** 20:6.1f} MB ({with_slots / args.count:.0f} bytes each)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
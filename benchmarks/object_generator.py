@@ -0,0 +1,75 @@
+"""
+Times the conversion of api payloads into models for all eight model types.
+
+Compares the constructor path (one lookup per field passed to __init__, as
+ObjectGenerator did before its field maps were compiled) with the compiled
+to_* converters and the bulk ObjectGenerator.*_objects converters.
+
+    python benchmarks/object_generator.py [--count N] [--repeat N]
+"""
+import argparse
+import inspect
+import sys
+import timeit
+
+from payloads import FIELD_MAPS, payloads
+
+from yaybot import models, utils
+
+
+MODELS = {
+    'user': models.User,
+    'group_user': models.GroupUser,
+    'post': models.Post,
+    'review': models.Review,
+    'group': models.Group,
+    'chat_room': models.ChatRoom,
+    'message': models.Message,
+    'activity': models.Activity,
+}
+
+# constructor arguments named differently from the attribute they fill
+ALIASES = {'is_private': 'private_user'}
+
+
+def constructor_path(kind):
+    cls = MODELS[kind]
+    params = [name for name in inspect.signature(cls.__init__).parameters if name != 'self']
+    getters = dict((attr, utils.path_getter(path)) for attr, path in FIELD_MAPS[kind])
+    getters = [(name, getters[ALIASES.get(name, name)]) for name in params]
+
+    def convert(data):
+        return cls(**{name: getter(data) for name, getter in getters})
+    return convert
+
+
+def best_of(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    generator = utils.ObjectGenerator()
+    print(f'us per object, {args.count} payloads, best of {args.repeat}')
+    print(f'{"model":<12}{"__init__":>10}{"to_*":>10}{"*_objects":>11}')
+    for kind in MODELS:
+        items = payloads(kind, args.count)
+        old = constructor_path(kind)
+        single = getattr(utils, f'to_{kind}')
+        bulk = getattr(generator, f'{kind}_objects')
+        times = [
+            best_of(lambda: [old(data) for data in items], args.repeat),
+            best_of(lambda: [single(data) for data in items], args.repeat),
+            best_of(lambda: bulk(items), args.repeat),
+        ]
+        us = [t / args.count * 1e6 for t in times]
+        print(f'{kind:<12}{us[0]:>10.1f}{us[1]:>10.1f}{us[2]:>11.1f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
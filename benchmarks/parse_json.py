@@ -0,0 +1,50 @@
+"""
+Times decoding of large response bodies with the stdlib json module and orjson.
+
+Uses a followers page (50 users) and a timeline page (100 posts with their
+authors), encoded as the raw bytes handle_response receives. The yaybot row is
+utils.json_loads, the decoder the client actually uses here.
+
+    python benchmarks/parse_json.py [--repeat N]
+"""
+import argparse
+import json
+import sys
+import timeit
+
+from payloads import followers_page, timeline_page
+
+from yaybot import utils
+
+
+def decoders():
+    found = [('json', json.loads)]
+    try:
+        import orjson
+        found.append(('orjson', orjson.loads))
+    except ImportError:
+        print('orjson is not installed, pip install yaybot[fast] to compare it')
+    found.append((f'yaybot ({utils.json_loads.__module__})', utils.json_loads))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    bodies = [
+        ('followers page, 50 users', json.dumps(followers_page(50), ensure_ascii=False).encode()),
+        ('timeline page, 100 posts', json.dumps(timeline_page(100), ensure_ascii=False).encode()),
+    ]
+    available = decoders()
+    for name, body in bodies:
+        print(f'{name}, {len(body) / 1024:.0f} KiB')
+        for label, loads in available:
+            best = min(timeit.repeat(lambda: loads(body), number=1, repeat=args.repeat))
+            print(f'  {label:<24}{best * 1e6:>8.0f} us')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Synthetic api payloads for the benchmarks.
+
+Every payload is built from the model field maps in yaybot.utils, so each
+field the converters read is present and has a plausible type.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from yaybot import utils  # noqa: E402
+
+
+FIELD_MAPS = {
+    'user': utils.USER_FIELDS,
+    'group_user': utils.GROUP_USER_FIELDS,
+    'post': utils.POST_FIELDS,
+    'review': utils.REVIEW_FIELDS,
+    'group': utils.GROUP_FIELDS,
+    'chat_room': utils.CHAT_ROOM_FIELDS,
+    'message': utils.MESSAGE_FIELDS,
+    'activity': utils.ACTIVITY_FIELDS,
+}
+
+# free text fields get a realistic amount of non-ascii text
+TEXT_KEYS = {'text', 'biography', 'comment', 'description', 'guidelines', 'nickname', 'topic'}
+
+
+def steps(path):
+    parsed = []
+    for part in path.split('.'):
+        name, _, index = part.partition('[')
+        if name:
+            parsed.append(name)
+        if index:
+            index = index.rstrip(']')
+            parsed.append(index if index == '*' else int(index))
+    return parsed
+
+
+def sample(key, seed):
+    if key in TEXT_KEYS:
+        return f'テスト{seed} ' + 'これはベンチマーク用の文章です。' * 4
+    if key == 'id' or key.endswith('_id') or key.endswith('_at') or key.endswith('count'):
+        return 1_000_000 + seed
+    if key.startswith('is_') or key.startswith('allow_') or key.startswith('hide_'):
+        return seed % 2 == 0
+    return f'{key}-{seed}'
+
+
+def put(data, path_steps, value):
+    step, rest = path_steps[0], path_steps[1:]
+    if not rest:
+        data[step] = value
+        return
+    following = rest[0]
+    if following == '*' or isinstance(following, int):
+        items = data.get(step)
+        if not isinstance(items, list):
+            items = data[step] = [{} for _ in range(3)]
+        targets = items if following == '*' else [items[following]]
+        for item in targets:
+            put(item, rest[1:], value)
+        return
+    child = data.get(step)
+    if not isinstance(child, dict):
+        child = data[step] = {}
+    put(child, rest, value)
+
+
+def payload(kind: str, seed: int = 0) -> dict:
+    """kind ('user', 'post', ...) の全フィールドを含む dict を返す"""
+    data = {}
+    for _, path in FIELD_MAPS[kind]:
+        parsed = steps(path)
+        put(data, parsed, sample(parsed[-1], seed))
+    return data
+
+
+def payloads(kind: str, count: int) -> list:
+    return [payload(kind, seed) for seed in range(count)]
+
+
+def followers_page(count: int = 50) -> dict:
+    return {'users': payloads('user', count), 'last_follow_id': count}
+
+
+def timeline_page(count: int = 100) -> dict:
+    posts = payloads('post', count)
+    for seed, post in enumerate(posts):
+        # timeline posts carry the full author, not just the two fields Post reads
+        post['user'] = payload('user', seed)
+    return {'posts': posts, 'next_page_value': count}
@@ -30,6 +30,15 @@ setup(
         'beautifulsoup4',
         'tqdm',
         'huepy',
+        'fake-useragent',
         'python-dotenv',
-    ]
+    ],
+    extras_require={
+        # faster JSON decoding of API responses
+        'fast': ['orjson'],
+        # vectorized filtering and sorting of as_columns=True results
+        'columns': ['numpy'],
+        # zstd compressed output of yaybot.export
+        'zstd': ['zstandard'],
+    }
 )
@@ -1,8 +1,10 @@
 from . import config
 from . import exceptions
+from . import export
 from . import models
+from . import storage
 from . import utils
-from .api import Yay
+from .api import Yay, AsyncYay, YayPool
 
 __version__ = '0.3.3'  # also change api / api.py
-__all__ = ['config', 'exceptions', 'models', 'support', 'utils', 'Yay']
+__all__ = ['config', 'exceptions', 'export', 'models', 'storage', 'support', 'utils', 'Yay', 'AsyncYay', 'YayPool']
@@ -1,3 +1,6 @@
 from .api import Yay
+from .api_async import AsyncYay
+from .api_pool import YayPool
+from .api_request import RetryPolicy
 
-__all__ = ['Yay']
+__all__ = ['Yay', 'AsyncYay', 'YayPool', 'RetryPolicy']
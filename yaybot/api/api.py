@@ -2,9 +2,11 @@ import datetime
 import logging
 import os
 import random
-import requests
+import threading
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ..config import Endpoints as ep
 from ..exceptions import (
     YayError,
@@ -15,15 +17,33 @@ from ..exceptions import (
     InvalidSignedInfo,
     UnknownError
 )
-from ..utils import handle_response, console_print
+from ..utils import BATCH_SIZE, handle_response, console_print
 from .api_auth import YayAuth
+from .api_request import RetryPolicy, request
+from .state.api_cashe import YayCache, SQLiteCache
+from .state.api_concurrency import AdaptiveConcurrency
+from .state.api_credentials import YayCredentials
+from .state.api_limiter import RateLimiter
+from .state.api_metrics import YayMetrics
+from .state.api_proxy import ProxyPool
+from .state.api_state import YayState
 from .api_chat import (
     send_message,
     accept_chat_request,
-    delete_chat_room
+    accept_chat_requests,
+    delete_chat_room,
+    delete_chat_rooms,
 )
 from .api_get import (
+    Paginator,
+    iter_followers,
+    iter_followings,
+    iter_hima_users,
+    iter_letters,
+    iter_likers,
+    iter_timeline,
     get_user,
+    get_users,
     get_users_from_dict,
     get_hima_users,
     get_hima_users_from_dict,
@@ -36,6 +56,7 @@ from .api_get import (
     get_user_active_call,
     get_blocked_users,
     get_post,
+    get_posts,
     get_posts_from_dict,
     get_timeline,
     get_following_timeline,
@@ -43,6 +64,7 @@ from .api_get import (
     get_reposts,
     get_post_likers,
     get_group,
+    get_groups,
     get_groups_from_dict,
     get_group_users_from_dict,
     get_group_timeline,
@@ -85,9 +107,11 @@ from .api_post import (
     create_repost,
     create_reply,
     delete_post,
+    delete_posts,
     pin_post,
     unpin_post,
     like_post,
+    like_posts,
     unlike_post,
 )
 from .api_user import (
@@ -116,6 +140,20 @@ class Yay(object):
             log_filename: str = None,
             loglevel_file=logging.DEBUG,
             loglevel_stream=logging.INFO,
+            pool_connections=10,
+            pool_maxsize=10,
+            pool_block=False,
+            keep_alive=True,
+            cache=None,
+            max_workers=8,
+            prefetch=1,
+            retry_policy: RetryPolicy = None,
+            rate_limiter: RateLimiter = None,
+            concurrency: AdaptiveConcurrency = None,
+            lazy_models=False,
+            credentials=False,
+            proxy_pool: ProxyPool = None,
+            metrics: YayMetrics = None,
     ):
         """
 
@@ -173,7 +211,77 @@ class Yay(object):
             self.logger.addHandler(ch)
         self.logger.setLevel(logging.DEBUG)
 
-        self.auth = YayAuth(proxy=proxy, timeout=timeout)
+        # cache=True or 'memory' uses an in-memory YayCache,
+        # cache='disk' keeps the payloads in base_path/cache.sqlite3;
+        # a cache object passed in may be shared and is left open on close()
+        self._owns_cache = cache is True or cache in ('memory', 'disk')
+        if cache is True or cache == 'memory':
+            cache = YayCache()
+        elif cache == 'disk':
+            cache = SQLiteCache(os.path.join(base_path, 'cache.sqlite3'))
+        self.cache = cache
+
+        # shared by requests that run side by side (e.g. get_user)
+        self.max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # pages fetched ahead while the current one is being processed
+        self.prefetch = prefetch
+
+        # pass RetryPolicy(max_attempts=1) to turn retrying off
+        self.retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+
+        # paces requests per endpoint family, may be shared between clients
+        self.rate_limiter = rate_limiter
+
+        # caps requests in flight, tuned by 429s, quota errors and latency
+        self.concurrency = AdaptiveConcurrency() if concurrency is True else concurrency
+        if self.concurrency is not None:
+            # get_many fans out to max_limit threads, keep a connection for each
+            pool_maxsize = max(pool_maxsize, self.concurrency.max_limit)
+
+        # User, Post and Group keep the raw payload and convert each
+        # field on first access
+        self.lazy_models = lazy_models
+
+        # checkpoints of paginated getters called with resume=True
+        self.state = YayState(os.path.join(base_path, 'state.json'))
+
+        # per endpoint counts, latency, sizes, statuses and exceptions;
+        # pass one YayMetrics to several clients to aggregate them
+        self._owns_metrics = metrics is True
+        self.metrics = YayMetrics() if metrics is True else metrics
+        if self.metrics is not None and self.concurrency is not None:
+            # the controller's limit and in-flight count become gauges
+            self.metrics.watch_concurrency(self.concurrency)
+
+        # proxy_pool spreads requests over several proxies, a list of
+        # proxies passed as proxy becomes a ProxyPool owned by this client
+        self._owns_proxy_pool = isinstance(proxy, (list, tuple))
+        if self._owns_proxy_pool:
+            proxy_pool = ProxyPool(
+                proxy, pool_connections, pool_maxsize, pool_block)
+            proxy = None
+        self.proxy_pool = proxy_pool
+
+        # opt-in: credentials=True keeps the tokens of each account in
+        # base_path/credentials.json so login() can skip the login round trips
+        if credentials is True:
+            credentials = YayCredentials(os.path.join(base_path, 'credentials.json'))
+        elif credentials is False:
+            credentials = None
+
+        self.auth = YayAuth(
+            proxy=proxy,
+            timeout=timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            credentials=credentials,
+            proxy_pool=proxy_pool
+        )
 
         if token:
             self.access_token = token
@@ -182,14 +290,38 @@ class Yay(object):
 
         self.logger.info('YayBot version: ' + version + ' Started!')
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        通信用のコネクションプールを閉じます。
+        ---
+            with文で使用した場合は自動的に呼ばれます。
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.auth.close()
+        if self._owns_proxy_pool:
+            self.proxy_pool.close()
+        if self._owns_metrics:
+            self.metrics.close()
+        if self._owns_cache and hasattr(self.cache, 'close'):
+            self.cache.close()
+
     def login(self, email, password):
         """
         ログインします。
         ---
             今後足跡が残ります。
         """
-        self.auth.login(email, password)
+        logged_in = self.auth.login(email, password)
         self.set_login_status()
+        return logged_in
 
     def logout(self):
         """
@@ -207,6 +339,13 @@ class Yay(object):
         self.api_key = self.auth.api_key
         self.logged_in_as = self.auth.logged_in_as
 
+    def _refresh_token(self, expired_token=None):
+        if not self.auth.refresh(expired_token):
+            return False
+        self.set_login_status()
+        self.logger.info('Access token refreshed.')
+        return True
+
     def pop_login_status(self):
         self.access_token = None
         self.refresh_token = None
@@ -215,45 +354,65 @@ class Yay(object):
         self.logged_in_as = None
 
     def _get(self, url: str):
-        resp = requests.get(url, headers=self.auth.headers,
-                            proxies=self.auth.proxies, timeout=self.auth.timeout)
-        handle_response(resp)
-        return resp.json()
+        return request(self, 'GET', url)
 
     def _post(self, url: str, data: dict = None):
-        resp = requests.post(url, params=data,
-                             headers=self.auth.headers,
-                             proxies=self.auth.proxies,
-                             timeout=self.auth.timeout)
-        handle_response(resp)
-        return resp.json()
+        return request(self, 'POST', url, data)
 
     def _put(self, url: str, data: dict = None):
-        resp = requests.put(url, params=data,
-                            headers=self.auth.headers,
-                            proxies=self.auth.proxies,
-                            timeout=self.auth.timeout)
-        handle_response(resp)
-        return resp.json()
+        return request(self, 'PUT', url, data)
 
     def _delete(self, url: str, data: dict = None):
-        resp = requests.delete(url, params=data,
-                               headers=self.auth.headers,
-                               proxies=self.auth.proxies,
-                               timeout=self.auth.timeout)
-        handle_response(resp)
-        return resp.json()
+        return request(self, 'DELETE', url, data)
+
+    def _submit(self, func, *args, **kwargs):
+        # only submit plain requests here, never a task that waits on
+        # another submitted task, so the shared pool can't deadlock
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='yaybot')
+            return self._executor.submit(func, *args, **kwargs)
+
+    def _ensure_workers(self, workers: int):
+        # callers running more get_user calls side by side than max_workers
+        # widen the shared pool, otherwise their /info halves queue up on it;
+        # the old pool still finishes what was already submitted
+        with self._executor_lock:
+            if workers <= self.max_workers:
+                return
+            self.max_workers = workers
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _cache_get(self, endpoint: str, key):
+        if self.cache is None:
+            return None
+        return self.cache.get(endpoint, key)
+
+    def _cache_set(self, endpoint: str, key, value):
+        if self.cache is not None and value is not None:
+            self.cache.set(endpoint, key, value)
+
+    def _invalidate(self, endpoint: str, *keys):
+        if self.cache is None:
+            return
+        for key in keys:
+            if key is not None:
+                self.cache.invalidate(endpoint, key)
 
     # ====== GETTERS ======
 
     # user
-    def get_user(self, user_id: str):
+    def get_user(self, user_id: str, lite: bool = False):
         """
 
         ユーザーの情報を取得します。
 
         Parameters:
             user_id (str): ユーザーのID
+            lite (bool): Trueにすると基本的なプロフィールのみを1回の通信で取得します。
 
         Returns:
             User: ユーザーのオブジェクト
@@ -263,15 +422,38 @@ class Yay(object):
         >>> get_user('123').screen_name
 
         """
-        return get_user(self, user_id)
+        return get_user(self, user_id, lite)
+
+    def get_users(self, user_ids: list, max_workers: int = None, return_exceptions: bool = False):
+        """
+
+        複数のユーザーの情報をまとめて取得します。\n
+        重複したIDは1回だけ取得し、キャッシュにあるものは通信せずに返します。
+
+        Parameters:
+            user_ids (list): ユーザーのIDのリスト
+            max_workers (int): 同時に実行するリクエストの数 (任意)
+            return_exceptions (bool): Trueにすると取得に失敗したIDの位置に例外を返します。
+                (Falseの場合はNone)
+
+        Returns:
+            User (list): user_idsと同じ順番のオブジェクトのリスト
+
+        Examples:
+        >>> [user.screen_name for user in get_users(['123', '456']) if user]
+
+        """
+        return get_users(self, user_ids, max_workers, return_exceptions)
 
-    def get_hima_users(self, amount: int = None):
+    def get_hima_users(self, amount: int = None, resume: bool = False, as_columns: bool = False):
         """
 
         暇なユーザーを取得します。
 
         Parameters:
             amount (int): 取得するユーザーの数 (任意、最大で約200～500人くらい)
+            resume (bool): Trueにすると途中経過を保存し、前回中断した取得を再開します。(中断前に取得したページも含めて返します)
+            as_columns (bool): Trueにすると列ごとにまとめた Columns を返します。
 
         Returns:
             User: ユーザーのオブジェクト
@@ -281,7 +463,24 @@ class Yay(object):
         >>> get_user('123').screen_name
 
         """
-        return get_hima_users(self, amount)
+        return get_hima_users(self, amount, resume, as_columns)
+
+    def iter_hima_users(self, amount: int = None, cursor: str = None, resume: bool = False) -> Paginator:
+        """
+
+        暇なユーザーを1ページずつ取得するイテレーターを返します。\n
+        すべてをリストに溜めずに、取得したそばから処理できます。
+
+        Parameters:
+            amount (int): 取得する数 (任意)
+            cursor (str): 再開する位置 (from_hima_id、中断したイテレーターのcursor属性)
+            resume (bool): Trueにすると前回中断したページの続きから取得します。(それ以前のページは返しません)
+
+        Returns:
+            Paginator: Userオブジェクトを返すイテレーター
+
+        """
+        return iter_hima_users(self, amount, cursor, resume)
 
     def get_users_from_dict(self, resp: dict):
         return get_users_from_dict(self, resp)
@@ -292,7 +491,7 @@ class Yay(object):
     def get_letters_from_dict(self, resp: dict):
         return get_letters_from_dict(self, resp)
 
-    def get_letters(self, user_id: str, amount: int = None):
+    def get_letters(self, user_id: str, amount: int = None, resume: bool = False):
         """
 
         ユーザーが受け取ったレターを取得します。
@@ -300,12 +499,31 @@ class Yay(object):
         Parameters:
             user_id (str): ユーザーのID
             amount (int): 取得するレターの数
+            resume (bool): Trueにすると途中経過を保存し、前回中断した取得を再開します。(中断前に取得したページも含めて返します)
 
         Returns:
             Letter (list): レターオブジェクトのリスト
 
         """
-        return get_letters(self, user_id, amount)
+        return get_letters(self, user_id, amount, resume)
+
+    def iter_letters(self, user_id: str, amount: int = None, cursor: str = None, resume: bool = False) -> Paginator:
+        """
+
+        ユーザーが受け取ったレターを1ページずつ取得するイテレーターを返します。\n
+        すべてをリストに溜めずに、取得したそばから処理できます。
+
+        Parameters:
+            user_id (str): ユーザーのID
+            amount (int): 取得する数 (任意)
+            cursor (str): 再開する位置 (from_id、中断したイテレーターのcursor属性)
+            resume (bool): Trueにすると前回中断したページの続きから取得します。(それ以前のページは返しません)
+
+        Returns:
+            Paginator: Reviewオブジェクトを返すイテレーター
+
+        """
+        return iter_letters(self, user_id, amount, cursor, resume)
 
     def get_joined_groups(self, user_id: str, amount=100):
         """
@@ -322,7 +540,7 @@ class Yay(object):
         """
         return get_joined_groups(self, user_id, amount)
 
-    def get_user_followers(self, user_id: str, amount: int = None):
+    def get_user_followers(self, user_id: str, amount: int = None, resume: bool = False, as_columns: bool = False):
         """
 
         ユーザーのフォロワーを取得します。
@@ -330,14 +548,34 @@ class Yay(object):
         Parameters:
             user_id (str): ユーザーのID
             amount (int): 取得するユーザーの数
+            resume (bool): Trueにすると途中経過を保存し、前回中断した取得を再開します。(中断前に取得したページも含めて返します)
+            as_columns (bool): Trueにすると列ごとにまとめた Columns を返します。
 
         Returns:
             User (list): ユーザーオブジェクトのリスト
 
         """
-        return get_user_followers(self, user_id, amount)
+        return get_user_followers(self, user_id, amount, resume, as_columns)
+
+    def iter_followers(self, user_id: str, amount: int = None, cursor: str = None, resume: bool = False) -> Paginator:
+        """
+
+        ユーザーのフォロワーを1ページずつ取得するイテレーターを返します。\n
+        すべてをリストに溜めずに、取得したそばから処理できます。
+
+        Parameters:
+            user_id (str): ユーザーのID
+            amount (int): 取得する数 (任意)
+            cursor (str): 再開する位置 (last_follow_id、中断したイテレーターのcursor属性)
+            resume (bool): Trueにすると前回中断したページの続きから取得します。(それ以前のページは返しません)
+
+        Returns:
+            Paginator: Userオブジェクトを返すイテレーター
+
+        """
+        return iter_followers(self, user_id, amount, cursor, resume)
 
-    def get_user_followings(self, user_id, amount=None):
+    def get_user_followings(self, user_id, amount=None, resume: bool = False, as_columns: bool = False):
         """
 
         ユーザーのフォロー中を取得します。
@@ -345,12 +583,32 @@ class Yay(object):
         Parameters:
             user_id (str): ユーザーのID
             amount (int): 取得するユーザーの数
+            resume (bool): Trueにすると途中経過を保存し、前回中断した取得を再開します。(中断前に取得したページも含めて返します)
+            as_columns (bool): Trueにすると列ごとにまとめた Columns を返します。
 
         Returns:
             User (list): ユーザーオブジェクトのリスト
 
         """
-        return get_user_followings(self, user_id, amount)
+        return get_user_followings(self, user_id, amount, resume, as_columns)
+
+    def iter_followings(self, user_id: str, amount: int = None, cursor: str = None, resume: bool = False) -> Paginator:
+        """
+
+        ユーザーのフォロー中を1ページずつ取得するイテレーターを返します。\n
+        すべてをリストに溜めずに、取得したそばから処理できます。
+
+        Parameters:
+            user_id (str): ユーザーのID
+            amount (int): 取得する数 (任意)
+            cursor (str): 再開する位置 (last_follow_id、中断したイテレーターのcursor属性)
+            resume (bool): Trueにすると前回中断したページの続きから取得します。(それ以前のページは返しません)
+
+        Returns:
+            Paginator: Userオブジェクトを返すイテレーター
+
+        """
+        return iter_followings(self, user_id, amount, cursor, resume)
 
     def get_follow_requests(self, amount=100):
         """
@@ -417,10 +675,31 @@ class Yay(object):
         """
         return get_post(self, post_id)
 
+    def get_posts(self, post_ids: list, max_workers: int = None, return_exceptions: bool = False):
+        """
+
+        複数の投稿の情報をまとめて取得します。\n
+        重複したIDは1回だけ取得し、キャッシュにあるものは通信せずに返します。
+
+        Parameters:
+            post_ids (list): 投稿のIDのリスト
+            max_workers (int): 同時に実行するリクエストの数 (任意)
+            return_exceptions (bool): Trueにすると取得に失敗したIDの位置に例外を返します。
+                (Falseの場合はNone)
+
+        Returns:
+            Post (list): post_idsと同じ順番のオブジェクトのリスト
+
+        Examples:
+        >>> [post.text for post in get_posts(['123', '456']) if post]
+
+        """
+        return get_posts(self, post_ids, max_workers, return_exceptions)
+
     def get_posts_from_dict(self, resp: dict):
         return get_posts_from_dict(self, resp)
 
-    def get_timeline(self, user_id: str = None, keyword: str = None, hashtag: str = None, amount=100):
+    def get_timeline(self, user_id: str = None, keyword: str = None, hashtag: str = None, amount=100, resume: bool = False, as_columns: bool = False):
         """
 
         タイムラインの投稿を取得します。
@@ -430,12 +709,31 @@ class Yay(object):
             keyword (str): キーワード (特定の単語が含まれている投稿を取得する場合)
             hashtag (str): ハッシュタグ (特定のタグが含まれている投稿を取得する場合)
             amount (int): 取得する投稿の数
+            resume (bool): Trueにすると途中経過を保存し、前回中断した取得を再開します。(中断前に取得したページも含めて返します)
+            as_columns (bool): Trueにすると列ごとにまとめた Columns を返します。
 
         Returns:
             Post (list): 投稿オブジェクトのリスト
 
         """
-        return get_timeline(self, user_id, keyword, hashtag, amount)
+        return get_timeline(self, user_id, keyword, hashtag, amount, resume, as_columns)
+
+    def iter_timeline(self, amount: int = None, cursor: str = None, resume: bool = False) -> Paginator:
+        """
+
+        タイムラインの投稿を1ページずつ取得するイテレーターを返します。\n
+        すべてをリストに溜めずに、取得したそばから処理できます。
+
+        Parameters:
+            amount (int): 取得する数 (任意)
+            cursor (str): 再開する位置 (next_page_value、中断したイテレーターのcursor属性)
+            resume (bool): Trueにすると前回中断したページの続きから取得します。(それ以前のページは返しません)
+
+        Returns:
+            Paginator: Postオブジェクトを返すイテレーター
+
+        """
+        return iter_timeline(self, amount, cursor, resume)
 
     def get_following_timeline(self, amount=50):
         """
@@ -482,7 +780,7 @@ class Yay(object):
         """
         return get_reposts(self, post_id, amount)
 
-    def get_post_likers(self, post_id, amount: int = None):
+    def get_post_likers(self, post_id, amount: int = None, resume: bool = False, as_columns: bool = False):
         """
 
         投稿にいいねしたユーザーを取得します。
@@ -490,12 +788,32 @@ class Yay(object):
         Parameters:
             post_id (str): 投稿のID
             amount (int): 取得する投稿の数 (任意)
+            resume (bool): Trueにすると途中経過を保存し、前回中断した取得を再開します。(中断前に取得したページも含めて返します)
+            as_columns (bool): Trueにすると列ごとにまとめた Columns を返します。
 
         Returns:
             User (list): ユーザーオブジェクトのリスト
 
         """
-        return get_post_likers(self, post_id, amount)
+        return get_post_likers(self, post_id, amount, resume, as_columns)
+
+    def iter_likers(self, post_id: str, amount: int = None, cursor: str = None, resume: bool = False) -> Paginator:
+        """
+
+        投稿にいいねしたユーザーを1ページずつ取得するイテレーターを返します。\n
+        すべてをリストに溜めずに、取得したそばから処理できます。
+
+        Parameters:
+            post_id (str): 投稿のID
+            amount (int): 取得する数 (任意)
+            cursor (str): 再開する位置 (last_id、中断したイテレーターのcursor属性)
+            resume (bool): Trueにすると前回中断したページの続きから取得します。(それ以前のページは返しません)
+
+        Returns:
+            Paginator: Userオブジェクトを返すイテレーター
+
+        """
+        return iter_likers(self, post_id, amount, cursor, resume)
 
     # group
     def get_group(self, group_id: str):
@@ -516,6 +834,27 @@ class Yay(object):
         """
         return get_group(self, group_id)
 
+    def get_groups(self, group_ids: list, max_workers: int = None, return_exceptions: bool = False):
+        """
+
+        複数のサークルの情報をまとめて取得します。\n
+        重複したIDは1回だけ取得し、キャッシュにあるものは通信せずに返します。
+
+        Parameters:
+            group_ids (list): サークルのIDのリスト
+            max_workers (int): 同時に実行するリクエストの数 (任意)
+            return_exceptions (bool): Trueにすると取得に失敗したIDの位置に例外を返します。
+                (Falseの場合はNone)
+
+        Returns:
+            Group (list): group_idsと同じ順番のオブジェクトのリスト
+
+        Examples:
+        >>> [group.group_name for group in get_groups(['123', '456']) if group]
+
+        """
+        return get_groups(self, group_ids, max_workers, return_exceptions)
+
     def get_groups_from_dict(self, resp: dict):
         return get_groups_from_dict(self, resp)
 
@@ -977,6 +1316,27 @@ class Yay(object):
         """
         return delete_post(self, post_id)
 
+    def delete_posts(self, post_ids: list, batch_size: int = BATCH_SIZE) -> list:
+        """
+
+        IDで指定した複数の投稿を削除します。\n
+        IDはbatch_size件ずつまとめて送信されるため、1件ずつ実行するより通信回数が少なくなります。
+
+        Parameters:
+            post_ids (list): 投稿のIDのリスト
+            batch_size (int): 1回のリクエストで送信するIDの数
+
+        Returns:
+            Result (list): リクエストごとの実行結果のリスト
+                (途中で失敗した場合、送出される例外の completed にそれまでの結果、
+                completed_ids に完了したID、failed_ids に完了が確認できなかったIDが入ります)
+
+        Examples:
+        >>> delete_posts(post_ids=['123', '456'])
+
+        """
+        return delete_posts(self, post_ids, batch_size)
+
     def pin_post(self, post_id: str) -> dict:
         """
 
@@ -1031,6 +1391,27 @@ class Yay(object):
         """
         return like_post(self, post_id)
 
+    def like_posts(self, post_ids: list, batch_size: int = BATCH_SIZE) -> list:
+        """
+
+        IDで指定した複数の投稿をいいねします。\n
+        IDはbatch_size件ずつまとめて送信されるため、1件ずつ実行するより通信回数が少なくなります。
+
+        Parameters:
+            post_ids (list): 投稿のIDのリスト
+            batch_size (int): 1回のリクエストで送信するIDの数
+
+        Returns:
+            Result (list): リクエストごとの実行結果のリスト
+                (途中で失敗した場合、送出される例外の completed にそれまでの結果、
+                completed_ids に完了したID、failed_ids に完了が確認できなかったIDが入ります)
+
+        Examples:
+        >>> like_posts(post_ids=['123', '456'])
+
+        """
+        return like_posts(self, post_ids, batch_size)
+
     def unlike_post(self, post_id: str) -> dict:
         """
 
@@ -1504,6 +1885,27 @@ class Yay(object):
         """
         return accept_chat_request(self, chat_room_id)
 
+    def accept_chat_requests(self, chat_room_ids: list, batch_size: int = BATCH_SIZE) -> list:
+        """
+
+        IDで指定した複数のチャットリクエストを承認します。\n
+        IDはbatch_size件ずつまとめて送信されるため、1件ずつ実行するより通信回数が少なくなります。
+
+        Parameters:
+            chat_room_ids (list): チャットリクエストのIDのリスト
+            batch_size (int): 1回のリクエストで送信するIDの数
+
+        Returns:
+            Result (list): リクエストごとの実行結果のリスト
+                (途中で失敗した場合、送出される例外の completed にそれまでの結果、
+                completed_ids に完了したID、failed_ids に完了が確認できなかったIDが入ります)
+
+        Examples:
+        >>> accept_chat_requests(chat_room_ids=['123', '456'])
+
+        """
+        return accept_chat_requests(self, chat_room_ids, batch_size)
+
     def delete_chat_room(self, chat_room_id: str) -> dict:
         """
 
@@ -1518,6 +1920,27 @@ class Yay(object):
         """
         return delete_chat_room(self, chat_room_id)
 
+    def delete_chat_rooms(self, chat_room_ids: list, batch_size: int = BATCH_SIZE) -> list:
+        """
+
+        IDで指定した複数のチャットルームを削除します。\n
+        IDはbatch_size件ずつまとめて送信されるため、1件ずつ実行するより通信回数が少なくなります。
+
+        Parameters:
+            chat_room_ids (list): チャットルームのIDのリスト
+            batch_size (int): 1回のリクエストで送信するIDの数
+
+        Returns:
+            Result (list): リクエストごとの実行結果のリスト
+                (途中で失敗した場合、送出される例外の completed にそれまでの結果、
+                completed_ids に完了したID、failed_ids に完了が確認できなかったIDが入ります)
+
+        Examples:
+        >>> delete_chat_rooms(chat_room_ids=['123', '456'])
+
+        """
+        return delete_chat_rooms(self, chat_room_ids, batch_size)
+
     # ====== SUPPORT ======
 
     def console_print(self, text: str, color: str = None) -> None:
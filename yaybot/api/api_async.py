@@ -0,0 +1,77 @@
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .api import Yay
+
+
+class AsyncYay(object):
+
+    def __init__(self, *args, max_concurrency: int = 100, **kwargs):
+        """
+
+        AsyncYay
+        ---
+            Yayのすべてのメソッドをawaitできる形で提供します。\n
+            同時に実行されるリクエストの数は max_concurrency までに制限されます。
+
+        Examples:
+        >>> async with AsyncYay(token='トークン') as yay:
+        >>>     users = await asyncio.gather(*[yay.get_user(i) for i in ids])
+        >>>     async for user in yay.iter_followers('123'):
+        >>>         print(user.screen_name)
+
+        """
+        # one keep-alive connection per worker, and as many workers for the
+        # requests a method runs side by side (e.g. the two halves of get_user)
+        kwargs.setdefault('pool_maxsize', max_concurrency)
+        kwargs.setdefault('max_workers', max_concurrency)
+        self.yay = Yay(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix='yaybot')
+
+    def __getattr__(self, name):
+        attr = getattr(self.yay, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        if name.startswith('iter_'):
+            @functools.wraps(attr)
+            async def iterator(*args, **kwargs):
+                # each page is fetched on the pool, items are yielded on the loop
+                pages = attr(*args, **kwargs).iter_pages()
+                while True:
+                    page = await self._run(next, pages, None)
+                    if page is None:
+                        break
+                    for item in page:
+                        yield item
+
+            return iterator
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._run(attr, *args, **kwargs)
+
+        return method
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs))
+
+    async def close(self):
+        """
+        実行中のリクエストの完了を待ち、コネクションプールを閉じます。
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.executor.shutdown)
+        self.yay.close()
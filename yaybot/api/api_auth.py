@@ -1,8 +1,6 @@
-import requests
 import re
-
-from fake_useragent import UserAgent
-from bs4 import BeautifulSoup
+import threading
+import time
 
 from ..config import Endpoints as ep
 from ..exceptions import (
@@ -16,11 +14,46 @@ from ..exceptions import (
 from ..utils import handle_response, console_print
 
 
+# used when fake_useragent is missing or cannot load its data
+FALLBACK_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+_user_agent = None
+_user_agent_lock = threading.Lock()
+
+
+def default_user_agent():
+    # fake_useragent loads (and may download) its whole database, so it is
+    # asked only once per process and the answer is shared by every client
+    global _user_agent
+    if _user_agent is None:
+        with _user_agent_lock:
+            if _user_agent is None:
+                try:
+                    from fake_useragent import UserAgent
+                    _user_agent = UserAgent().chrome
+                except Exception:
+                    _user_agent = FALLBACK_USER_AGENT
+    return _user_agent
+
+
 class YayAuth(object):
 
-    def __init__(self, proxy=None, timeout=10):
+    def __init__(
+            self,
+            proxy=None,
+            timeout=10,
+            pool_connections=10,
+            pool_maxsize=10,
+            pool_block=False,
+            keep_alive=True,
+            credentials=None,
+            proxy_pool=None
+    ):
         self.timeout = timeout
-        self.user_agent = UserAgent().chrome
+        self.user_agent = default_user_agent()
         self.proxy = proxy
         self.proxies = None
         if proxy:
@@ -38,24 +71,176 @@ class YayAuth(object):
             'X-Device-Info': f'Yay 3.12.1 Web ({self.user_agent})',
             'Origin': 'https://yay.space'
         }
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
         self.access_token = None
         self.refresh_token = None
         self.expires_in = None
+        self.expires_at = None
+        self.api_key = None
         self.logged_in_as = None
 
+        # YayCredentials, remembers the tokens of each email between runs
+        self.credentials = credentials
+        self.email = None
+        self._refresh_lock = threading.Lock()
+        # access token whose refresh was rejected, not tried again
+        self._refresh_failed_for = None
+
+        # ProxyPool, login and refresh leave from the account's sticky proxy
+        self.proxy_pool = proxy_pool
+
+        self.session = self.create_session(
+            pool_connections, pool_maxsize, pool_block)
+
+    @staticmethod
+    def create_session(pool_connections=10, pool_maxsize=10, pool_block=False):
+        # pool_connections: number of hosts to keep pools for
+        # pool_maxsize: keep-alive connections kept per host
+        # pool_block: if True, never open more than pool_maxsize per host
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self):
+        self.session.close()
+
+    @property
+    def proxy_key(self):
+        # the same account keeps the same proxy from login onwards
+        return self.email or self.logged_in_as or id(self)
+
+    def send(self, method, url, proxies=None, key=None, **kwargs):
+        if self.proxy_pool is None:
+            return self.session.request(
+                method, url, proxies=self.proxies if proxies is None else proxies,
+                timeout=self.timeout, **kwargs)
+        entry = self.proxy_pool.acquire(self.proxy_key if key is None else key)
+        started = time.monotonic()
+        try:
+            resp = entry.session.request(
+                method, url, proxies=entry.proxies, timeout=self.timeout, **kwargs)
+        except Exception as e:
+            self.proxy_pool.release(entry, time.monotonic() - started, e)
+            raise
+        self.proxy_pool.release(entry, time.monotonic() - started)
+        return resp
+
+    def set_tokens(self, access_token, refresh_token, expires_in=None,
+                   expires_at=None, user_id=None):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expires_in = expires_in
+        if expires_at is None and expires_in is not None:
+            expires_at = time.time() + expires_in
+        self.expires_at = expires_at
+        if user_id is not None:
+            self.logged_in_as = user_id
+        self.headers['Authorization'] = f'Bearer {access_token}'
+
+    def save_tokens(self):
+        if self.credentials is not None and self.email is not None:
+            self.credentials.save(
+                self.email, self.access_token, self.refresh_token,
+                self.expires_at, self.api_key, self.logged_in_as)
+
+    def forget(self):
+        """保存済みのトークンを削除する (次回の login() は通常のログインになります)"""
+        if self.credentials is not None and self.email is not None:
+            self.credentials.remove(self.email)
+
+    def needs_refresh(self, margin=60):
+        # refresh a little before the token actually expires
+        return (self.refresh_token is not None and self.expires_at is not None
+                and time.time() > self.expires_at - margin)
+
+    def refresh(self, expired_token=None):
+        """refresh_token でアクセストークンを更新する (成功した場合は True)"""
+        if self.refresh_token is None:
+            return False
+        with self._refresh_lock:
+            # another thread refreshed while this one was waiting
+            if expired_token is not None and self.access_token != expired_token:
+                return True
+            if expired_token is not None and expired_token == self._refresh_failed_for:
+                return False
+            params = {
+                'grant_type': 'refresh_token',
+                'refresh_token': self.refresh_token,
+            }
+            if self.api_key:
+                params['api_key'] = self.api_key
+            headers = dict(self.headers)
+            headers.pop('Authorization', None)
+            try:
+                resp_json = handle_response(self.send(
+                    'POST',
+                    ep.OAUTH_TOKEN,
+                    params=params,
+                    headers=headers
+                ))
+            except YayError:
+                # stop refreshing ahead of time, the threads waiting on the
+                # lock for the same token give up without another round trip
+                self.expires_at = None
+                self._refresh_failed_for = self.access_token
+                return False
+            self.set_tokens(
+                resp_json['access_token'],
+                resp_json.get('refresh_token', self.refresh_token),
+                resp_json.get('expires_in'),
+                user_id=resp_json.get('user_id'))
+            self.save_tokens()
+            return True
+
+    def restore(self, email):
+        """保存済みのトークンを更新して使う (拒否された場合は削除して False)"""
+        saved = self.credentials.load(email) if self.credentials is not None else None
+        if saved is None:
+            return False
+        self.email = email
+        self.api_key = saved['api_key']
+        self.set_tokens(
+            saved['access_token'], saved['refresh_token'],
+            expires_at=saved['expires_at'], user_id=saved['user_id'])
+        # a revoked token would otherwise look like a successful login,
+        # one refresh round trip proves the saved tokens are still accepted
+        if not self.refresh():
+            self.logout()
+            return False
+        return True
+
     def login(self, email, password):
-        resp = requests.get(
+        if self.restore(email):
+            console_print(
+                f'Successfully logged in as {self.logged_in_as}.', 'green')
+            return True
+
+        resp = self.send(
+            'GET',
             'https://yay.space/?modalMode=login',
             headers=self.headers,
             proxies={'http': self.proxy, 'https': self.proxy},
-            timeout=self.timeout
+            key=email
         )
 
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(resp.content, 'html.parser')
         script = soup.find_all('script')[2].string
         self.api_key = re.search(r'gon\.API_KEY="(.+?)"', script).group(1)
 
-        resp = requests.post(
+        resp = self.send(
+            'POST',
             f'{ep.USER_v2}/login_with_email',
             params={
                 'email': email,
@@ -64,21 +249,19 @@ class YayAuth(object):
                 'uuid': ''
             },
             headers=self.headers,
-            proxies=self.proxies,
-            timeout=self.timeout
+            key=email
         )
 
         try:
-            handle_response(resp)
-
-            self.access_token = resp.json()['access_token']
-            self.refresh_token = resp.json()['refresh_token']
-            self.expires_in = resp.json()['expires_in']
-            self.logged_in_as = resp.json()['user_id']
+            resp_json = handle_response(resp)
 
-            self.headers.setdefault(
-                'Authorization', f'Bearer {self.access_token}'
-            )
+            self.set_tokens(
+                resp_json['access_token'],
+                resp_json['refresh_token'],
+                resp_json['expires_in'],
+                user_id=resp_json['user_id'])
+            self.email = email
+            self.save_tokens()
 
             console_print(
                 f'Successfully logged in as {self.logged_in_as}.', 'green')
@@ -91,10 +274,13 @@ class YayAuth(object):
 
     def logout(self):
         if self.access_token:
+            self.forget()
             self.headers.pop('Authorization', None)
             self.access_token = None
             self.refresh_token = None
             self.expires_in = None
+            self.expires_at = None
             self.logged_in_as = None
+            self.email = None
         else:
             console_print('User is not logged in.', 'red')
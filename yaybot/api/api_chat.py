@@ -1,5 +1,5 @@
 from ..config import Endpoints as ep
-from ..utils import handle_response, console_print
+from ..utils import BATCH_SIZE, handle_response, console_print, post_batches
 
 
 def send_message(self, message, user_id=None, chat_room_id=None):
@@ -8,6 +8,7 @@ def send_message(self, message, user_id=None, chat_room_id=None):
     data = {'message_type': 'text', 'text': message}
     resp = self._post(
         f'{ep.CHATROOM_v1}/{chat_room_id}/messages/new', data)
+    self._invalidate('chat_rooms', chat_room_id)
     return resp
 
 
@@ -15,11 +16,25 @@ def accept_chat_request(self, chat_room_id):
     data = {'chat_room_ids[]': chat_room_id}
     resp = self._post(
         f'{ep.CHATROOM_v1}/accept_chat_request', data)
+    self._invalidate('chat_rooms', chat_room_id)
     return resp
 
 
+def accept_chat_requests(self, chat_room_ids, batch_size=BATCH_SIZE):
+    return post_batches(
+        self, f'{ep.CHATROOM_v1}/accept_chat_request', 'chat_room_ids[]',
+        chat_room_ids, batch_size, 'chat_rooms')
+
+
 def delete_chat_room(self, chat_room_id):
     data = {'chat_room_ids[]': chat_room_id}
     resp = self._post(
         f'{ep.CHATROOM_v1}/mass_destroy', data)
+    self._invalidate('chat_rooms', chat_room_id)
     return resp
+
+
+def delete_chat_rooms(self, chat_room_ids, batch_size=BATCH_SIZE):
+    return post_batches(
+        self, f'{ep.CHATROOM_v1}/mass_destroy', 'chat_room_ids[]',
+        chat_room_ids, batch_size, 'chat_rooms')
@@ -1,115 +1,313 @@
-from tqdm import tqdm
+import queue
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
+
+from ..columns import Columns, USER_COLUMNS, POST_COLUMNS
 from ..config import Endpoints as ep
 from ..utils import console_print, ObjectGenerator as gen
 
 
-# ====== USER ======
-
-
-def get_user(self, user_id):
-    resp1 = self._get(f'{ep.USER_v2}/{user_id}')['user']
-    resp2 = self._get(f'{ep.USER_v2}/info/{user_id}')['user']
-    resp1.update(resp2)
-    return gen.user_object(self, resp1)
-
-
-def get_hima_users(self, amount=None):
-    amount = float('inf') if amount is None else amount
-    number = min(amount, 100)
-
-    resp = self._get(
-        f'{ep.API_URL}/v1/web/users/hima_users?number={number}')
-    users = self.get_hima_users_from_dict(resp)
-
-    hima_users = resp.get('hima_users', [])
-    if not hima_users:
-        return users
-
-    next_item = hima_users[-1]
-    next_id = next_item['id']
-    amount -= 100
+# ====== PAGINATION ======
+
+
+class Paginator(object):
+
+    def __init__(self, yay, url, key, to_objects, next_cursor,
+                 cursor_param, page_size, amount=None, cursor=None, prefetch=None,
+                 checkpoint=None, resume=False, keep_pages=False):
+        """
+
+        Paginator
+        ---
+            カーソル形式のAPIを1ページずつ取得しながらオブジェクトを返します。\n
+            cursor属性に次のページのカーソルが入っているため、
+            途中で中断しても Yay.iter_*(cursor=...) で続きから再開できます。\n
+            prefetchに1以上を指定すると、現在のページを処理している間に
+            最大でその数だけ先のページを取得しておきます。\n
+            resume=Trueの場合はページを処理し終えるたびに Yay.state へ
+            checkpoint (エンドポイント, 対象のID) の途中経過を保存し、
+            保存済みの途中経過があればそこから再開します。
+            keep_pages=True (リストを返す get_* が指定) の場合は処理済みのページも保存し、
+            再開時には保存したページを先に返すため、中断前の分も失われません。
+
+        """
+        self.yay = yay
+        self.url = url
+        self.key = key
+        self.to_objects = to_objects
+        self.next_cursor = next_cursor
+        self.cursor_param = cursor_param
+        self.page_size = page_size
+        self.amount = float('inf') if amount is None else amount
+        self.cursor = cursor
+        self.prefetch = getattr(yay, 'prefetch', 0) if prefetch is None else prefetch
+        self.collected = 0
+        self.pages = 0
+
+        self.checkpoint = checkpoint if resume else None
+        self.keep_pages = keep_pages
+        # pages consumed before the checkpoint, replayed when keep_pages is set
+        self.saved_pages = 0
+        if self.checkpoint is not None and cursor is None:
+            saved = yay.state.load(*self.checkpoint)
+            if saved is not None and keep_pages and saved.get('pages') is None:
+                # left by an iter_* crawl that kept no pages, start over
+                saved = None
+            if saved is not None:
+                self.cursor = saved['cursor']
+                self.collected = saved['collected']
+                self.saved_pages = saved.get('pages') or 0
+
+    def __iter__(self):
+        for page in self.iter_pages():
+            yield from page
+
+    def page_url(self, number, cursor):
+        url = f'{self.url}&number={number}' if '?' in self.url else f'{self.url}?number={number}'
+        if cursor:
+            url += f'&{self.cursor_param}={cursor}'
+        return url
+
+    def fetch_pages(self):
+        # yields (resp, next cursor) for every non-empty page,
+        # independent of how far the caller has consumed
+        cursor = self.cursor
+        collected = self.collected
+        while collected < self.amount:
+            number = min(self.amount - collected, self.page_size)
+            resp = self.yay._get(self.page_url(number, cursor))
+            items = resp.get(self.key) or []
+            if len(items) > self.amount - collected:
+                items = resp[self.key] = items[:self.amount - collected]
+            cursor = self.next_cursor(resp)
+            if not items:
+                break
+            yield resp, cursor
+            collected += len(items)
+            if not cursor:
+                break
 
-    while next_id and amount > 0:
-        number = min(amount, 100)
+    def prefetch_pages(self, depth):
+        # runs on a thread of its own rather than the shared pool, as it
+        # blocks for as long as the caller takes to consume the pages
+        fetched = queue.Queue()
+        slots = threading.Semaphore(depth)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for page in self.fetch_pages():
+                    fetched.put(page)
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+            except BaseException as e:
+                fetched.put(e)
+            fetched.put(None)
+
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while True:
+                page = fetched.get()
+                if page is None:
+                    return
+                if isinstance(page, BaseException):
+                    raise page
+                yield page
+                slots.release()
+        finally:
+            stop.set()
+
+    def iter_raw_pages(self):
+        # self.cursor only moves past a page once the caller asks for the
+        # next one, so resuming from it never skips unconsumed items
+        state = self.yay.state
+        if self.checkpoint is not None and self.keep_pages:
+            for items in state.load_pages(*self.checkpoint, self.saved_pages):
+                yield {self.key: items}
+
+        if self.prefetch > 0:
+            pages = self.prefetch_pages(self.prefetch)
+        else:
+            pages = self.fetch_pages()
+        for resp, cursor in pages:
+            yield resp
+            self.cursor = cursor
+            self.collected += len(resp[self.key])
+            self.pages += 1
+            if self.checkpoint is not None:
+                # the page goes to disk before the checkpoint that counts it
+                if self.keep_pages:
+                    state.append_page(*self.checkpoint, resp[self.key])
+                    self.saved_pages += 1
+                state.save(*self.checkpoint, self.cursor, self.collected,
+                           self.saved_pages if self.keep_pages else None)
+
+        if self.checkpoint is not None:
+            state.remove(*self.checkpoint)
+
+    def iter_pages(self):
+        for resp in self.iter_raw_pages():
+            yield self.to_objects(self.yay, resp)
+
+
+def last_item_id(key):
+    def next_cursor(resp):
+        items = resp.get(key)
+        return items[-1]['id'] if items else None
+    return next_cursor
+
+
+def iter_followers(self, user_id, amount=None, cursor=None, resume=False, keep_pages=False):
+    return Paginator(
+        self, f'{ep.USER_v2}/{user_id}/web_followers', 'users',
+        get_users_from_dict, lambda resp: resp.get('last_follow_id'),
+        'from_follow_id', 50, amount, cursor,
+        checkpoint=('followers', user_id), resume=resume, keep_pages=keep_pages)
+
+
+def iter_followings(self, user_id, amount=None, cursor=None, resume=False, keep_pages=False):
+    return Paginator(
+        self, f'{ep.USER_v2}/{user_id}/web_followings', 'users',
+        get_users_from_dict, lambda resp: resp.get('last_follow_id'),
+        'from_follow_id', 50, amount, cursor,
+        checkpoint=('followings', user_id), resume=resume, keep_pages=keep_pages)
+
+
+def iter_hima_users(self, amount=None, cursor=None, resume=False, keep_pages=False):
+    return Paginator(
+        self, f'{ep.API_URL}/v1/web/users/hima_users', 'hima_users',
+        get_hima_users_from_dict, last_item_id('hima_users'),
+        'from_hima_id', 100, amount, cursor,
+        checkpoint=('hima_users', None), resume=resume, keep_pages=keep_pages)
+
+
+def iter_letters(self, user_id, amount=None, cursor=None, resume=False, keep_pages=False):
+    return Paginator(
+        self, f'{ep.USER_v1}/reviews/{user_id}?not_active=false', 'reviews',
+        get_letters_from_dict, last_item_id('reviews'),
+        'from_id', 100, amount, cursor,
+        checkpoint=('letters', user_id), resume=resume, keep_pages=keep_pages)
+
+
+def iter_likers(self, post_id, amount=None, cursor=None, resume=False, keep_pages=False):
+    return Paginator(
+        self, f'{ep.POST_v1}/{post_id}/likers', 'users',
+        get_users_from_dict, lambda resp: resp.get('last_id'),
+        'from_last_id', 50, amount, cursor,
+        checkpoint=('likers', post_id), resume=resume, keep_pages=keep_pages)
+
+
+def iter_timeline(self, amount=None, cursor=None, resume=False, keep_pages=False):
+    return Paginator(
+        self, ep.GET_TIMELINE, 'posts',
+        get_posts_from_dict, lambda resp: resp.get('next_page_value'),
+        'from_post_id', 100, amount, cursor,
+        checkpoint=('timeline', None), resume=resume, keep_pages=keep_pages)
+
+
+def collect(paginator, total, desc):
+    from tqdm import tqdm
+
+    items = []
+    with tqdm(total=total, desc=desc) as pbar:
+        for page in paginator.iter_pages():
+            items.extend(page)
+            pbar.update(len(page))
+    return items
+
+
+def collect_columns(paginator, spec, unwrap=None):
+    # builds the columns straight from the raw pages, no model objects
+    columns = Columns(spec)
+    for resp in paginator.iter_raw_pages():
+        items = resp.get(paginator.key) or []
+        if unwrap is not None:
+            items = [item.get(unwrap) or {} for item in items]
+        columns.extend(items)
+    return columns
 
-        resp = self._get(
-            f'{ep.API_URL}/v1/web/users/hima_users?from_hima_id={next_id}&number={number}')
-        users.extend(self.get_hima_users_from_dict(resp))
 
-        hima_users = resp.get('hima_users', [])
-        if not hima_users:
-            break
+# ====== USER ======
 
-        next_item = hima_users[-1]
-        next_id = next_item['id']
-        amount -= 100
 
-    return users
+def get_user(self, user_id, lite=False):
+    user_data = self._cache_get('users', user_id)
+    if user_data is None and lite:
+        # skips /info, so the partial payload is not cached
+        return gen.user_object(self, self._get(f'{ep.USER_v2}/{user_id}')['user'])
+    if user_data is None:
+        info = self._submit(self._get, f'{ep.USER_v2}/info/{user_id}')
+        user_data = self._get(f'{ep.USER_v2}/{user_id}')['user']
+        user_data.update(info.result()['user'])
+        self._cache_set('users', user_id, user_data)
+    return gen.user_object(self, user_data)
+
+
+def get_many(self, endpoint, get_one, to_object, ids, max_workers=None, return_exceptions=False):
+    # serves cached payloads directly and fans the rest out on a pool of its
+    # own, since get_one may itself wait on the shared pool (see get_user)
+    if max_workers is None:
+        # with an adaptive controller, let it decide how many actually run
+        max_workers = self.max_workers if self.concurrency is None else self.concurrency.max_limit
+    results = {}
+    pending = []
+    for item_id in dict.fromkeys(ids):
+        data = self._cache_get(endpoint, item_id)
+        if data is None:
+            pending.append(item_id)
+        else:
+            results[item_id] = to_object(self, data)
+
+    if pending:
+        workers = min(max_workers, len(pending))
+        self._ensure_workers(workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {item_id: executor.submit(get_one, item_id)
+                       for item_id in pending}
+            for item_id, future in futures.items():
+                try:
+                    results[item_id] = future.result()
+                except Exception as e:
+                    self.logger.warning(
+                        f'Failed to get {endpoint} {item_id}: {e!r}')
+                    results[item_id] = e if return_exceptions else None
+
+    return [results[item_id] for item_id in ids]
+
+
+def get_users(self, user_ids, max_workers=None, return_exceptions=False):
+    return get_many(self, 'users', self.get_user, gen.user_object,
+                    user_ids, max_workers, return_exceptions)
+
+
+def get_hima_users(self, amount=None, resume=False, as_columns=False):
+    paginator = iter_hima_users(self, amount, resume=resume, keep_pages=True)
+    if as_columns:
+        return collect_columns(paginator, USER_COLUMNS, unwrap='user')
+    return list(paginator)
 
 
 def get_users_from_dict(self, resp):
     assert 'users' in resp, "'users' key not found"
-    users_data = resp['users']
-    users = []
-    for user_data in users_data:
-        user = gen.user_object(self, user_data)
-        users.append(user)
-    return users
+    return gen.user_objects(self, resp['users'])
 
 
 def get_hima_users_from_dict(self, resp):
     assert 'hima_users' in resp, "'hima_users' key not found"
-    users_data = resp['hima_users']
-    users = []
-    for user_data in users_data:
-        user_data = user_data['user']
-        user = gen.user_object(self, user_data)
-        users.append(user)
-    return users
+    return gen.user_objects(self, [hima['user'] for hima in resp['hima_users']])
 
 
 def get_letters_from_dict(self, resp):
     assert 'reviews' in resp, "'reviews' key not found"
-    reviews_data = resp['reviews']
-    reviews = []
-    for review_data in reviews_data:
-        review = gen.review_object(self, review_data)
-        reviews.append(review)
-    return reviews
-
+    return gen.review_objects(self, resp['reviews'])
 
-def get_letters(self, user_id, amount=None):
-    amount = float('inf') if amount is None else amount
-    number = min(amount, 100)
 
-    resp = self._get(
-        f'{ep.USER_v1}/reviews/{user_id}?not_active=false&number={number}')
-    reviews = self.get_letters_from_dict(resp)
-
-    next_item = resp.get('reviews')[-1]
-    next_id = next_item['id']
-    reviews_count = self.get_user(user_id).num_reviews if amount == float(
-        'inf') else amount
-    amount -= 100
-
-    with tqdm(total=reviews_count, desc='Extracting Letters') as pbar:
-        while next_id and amount > 0:
-            number = min(amount, 100)
-
-            resp = self._get(
-                f'{ep.USER_v1}/reviews/{user_id}?from_id={next_id}&not_active=false&number={number}')
-            reviews.extend(self.get_letters_from_dict(resp))
-
-            if len(resp['reviews']) == 0:
-                break
-            next_item = resp['reviews'][-1]
-            next_id = next_item['id']
-            amount -= 100
-
-            pbar.update(number)
-
-    return reviews
+def get_letters(self, user_id, amount=None, resume=False):
+    reviews_count = self.get_user(user_id).num_reviews if amount is None else amount
+    return collect(iter_letters(self, user_id, amount, resume=resume, keep_pages=True),
+                   reviews_count, 'Extracting Letters')
 
 
 def get_joined_groups(self, user_id, amount=100):
@@ -118,62 +316,20 @@ def get_joined_groups(self, user_id, amount=100):
     return self.get_groups_from_dict(resp)
 
 
-def get_user_followers(self, user_id, amount=None):
-    amount = float('inf') if amount is None else amount
-    number = min(amount, 50)
-
-    resp = self._get(
-        f'{ep.USER_v2}/{user_id}/web_followers?number={number}')
-    users = self.get_users_from_dict(resp)
-
-    next_id = resp.get('last_follow_id')
-    followers_count = self.get_user(user_id).num_followers if amount == float(
-        'inf') else amount
-    amount -= 50
-
-    with tqdm(total=followers_count, desc='Extracting Followers') as pbar:
-        while next_id and amount > 0:
-            number = min(amount, 50)
-
-            resp = self._get(
-                f'{ep.USER_v2}/{user_id}/web_followers?from_follow_id={next_id}&number={number}')
-            users.extend(self.get_users_from_dict(resp))
-
-            next_id = resp.get('last_follow_id')
-            amount -= 50
-
-            pbar.update(number)
-
-    return users
+def get_user_followers(self, user_id, amount=None, resume=False, as_columns=False):
+    if as_columns:
+        return collect_columns(iter_followers(self, user_id, amount, resume=resume, keep_pages=True), USER_COLUMNS)
+    followers_count = self.get_user(user_id).num_followers if amount is None else amount
+    return collect(iter_followers(self, user_id, amount, resume=resume, keep_pages=True),
+                   followers_count, 'Extracting Followers')
 
 
-def get_user_followings(self, user_id, amount=None):
-    amount = float('inf') if amount is None else amount
-    number = min(amount, 50)
-
-    resp = self._get(
-        f'{ep.USER_v2}/{user_id}/web_followings?number={number}')
-    users = self.get_users_from_dict(resp)
-
-    next_id = resp.get('last_follow_id')
-    followings_count = self.get_user(user_id).num_followings if amount == float(
-        'inf') else amount
-    amount -= 50
-
-    with tqdm(total=followings_count, desc='Extracting Followings') as pbar:
-        while next_id and amount > 0:
-            number = min(amount, 50)
-
-            resp = self._get(
-                f'{ep.USER_v2}/{user_id}/web_followings?from_follow_id={next_id}&number=50')
-            users.extend(self.get_users_from_dict(resp))
-
-            next_id = resp.get('last_follow_id')
-            amount -= 50
-
-            pbar.update(number)
-
-    return users
+def get_user_followings(self, user_id, amount=None, resume=False, as_columns=False):
+    if as_columns:
+        return collect_columns(iter_followings(self, user_id, amount, resume=resume, keep_pages=True), USER_COLUMNS)
+    followings_count = self.get_user(user_id).num_followings if amount is None else amount
+    return collect(iter_followings(self, user_id, amount, resume=resume, keep_pages=True),
+                   followings_count, 'Extracting Followings')
 
 
 def get_follow_requests(self, amount):
@@ -200,66 +356,54 @@ def get_blocked_users(self, amount):
 
 
 def get_post(self, post_id):
-    resp = self._get(f'{ep.POST_v2}/{post_id}')
-    post_data = resp.get('post')
+    post_data = self._cache_get('posts', post_id)
+    if post_data is None:
+        resp = self._get(f'{ep.POST_v2}/{post_id}')
+        post_data = resp.get('post')
+        self._cache_set('posts', post_id, post_data)
     return gen.post_object(self, post_data)
 
 
+def get_posts(self, post_ids, max_workers=None, return_exceptions=False):
+    return get_many(self, 'posts', self.get_post, gen.post_object,
+                    post_ids, max_workers, return_exceptions)
+
+
 def get_posts_from_dict(self, resp):
     assert 'posts' in resp, "'posts' key not found"
-    posts_data = resp.get('posts')
-    posts = []
-    for post_data in posts_data:
-        post = gen.post_object(self, post_data)
-        posts.append(post)
-    return posts
+    return gen.post_objects(self, resp.get('posts'))
+
+
+def timeline_result(self, resp, as_columns):
+    if as_columns:
+        return Columns.from_items(POST_COLUMNS, resp.get('posts') or [])
+    return self.get_posts_from_dict(resp)
 
 
-def get_timeline(self, user_id=None, keyword=None, hashtag=None, amount=100):
+def get_timeline(self, user_id=None, keyword=None, hashtag=None, amount=100, resume=False, as_columns=False):
     if user_id or keyword or hashtag:
         if user_id:
             # https://api.yay.space/v2/posts/user_timeline?from_post_id=123&number=100&user_id={user_id}
             resp = self._get(
                 f'{ep.GET_USER_TIMELINE}?number={amount}&user_id={user_id}')
-            return self.get_posts_from_dict(resp)
+            return timeline_result(self, resp, as_columns)
         elif keyword:
             # https://api.yay.space/v2/posts/search?from_post_id=123&keyword={keyword}&number=100
             resp = self._get(
                 f'{ep.GET_TIMELINE_BY_KEYWORD}?keyword={keyword}&number={amount}')
-            return self.get_posts_from_dict(resp)
+            return timeline_result(self, resp, as_columns)
         elif hashtag:
             # https://api.yay.space/v2/posts/tags/{hashtag}?from_post_id=361102925&number=100
             resp = self._get(
                 f'{ep.GET_TIMELINE_BY_HASHTAG}/{hashtag}?number={amount}')
-            return self.get_posts_from_dict(resp)
+            return timeline_result(self, resp, as_columns)
     else:
-        number = min(amount, 100)
-
-        resp = self._get(
-            f'{ep.GET_TIMELINE}?number={number}')
-        posts = self.get_posts_from_dict(resp)
-
+        if as_columns:
+            return collect_columns(iter_timeline(self, amount, resume=resume, keep_pages=True), POST_COLUMNS)
         if amount <= 100:
-            return posts
-
-        posts_count = amount
-        next_id = resp.get('next_page_value')
-        amount -= 100
-
-        with tqdm(total=posts_count, desc='Extracting Posts') as pbar:
-            while next_id and amount > 0:
-                number = min(amount, 100)
-
-                resp = self._get(
-                    f'{ep.GET_TIMELINE}?from_post_id={next_id}&number={number}')
-                posts.extend(self.get_posts_from_dict(resp))
-
-                next_id = resp.get('next_page_value')
-                amount -= 100
-
-                pbar.update(number)
-
-        return posts
+            return list(iter_timeline(self, amount, resume=resume, keep_pages=True))
+        return collect(iter_timeline(self, amount, resume=resume, keep_pages=True),
+                       amount, 'Extracting Posts')
 
 
 def get_following_timeline(self, amount=50):
@@ -285,63 +429,40 @@ def get_reposts(self, post_id, amount=100):
     return self.get_posts_from_dict(resp)
 
 
-def get_post_likers(self, post_id, amount=None):
+def get_post_likers(self, post_id, amount=None, resume=False, as_columns=False):
+    if as_columns:
+        return collect_columns(iter_likers(self, post_id, amount, resume=resume, keep_pages=True), USER_COLUMNS)
     likes_count = self.get_post(post_id).num_likes
     amount = likes_count if amount is None else amount
-    number = min(amount, 50)
-
-    resp = self._get(
-        f'{ep.POST_v1}/{post_id}/likers?number={number}')
-
-    users = self.get_users_from_dict(resp)
-
-    next_id = resp.get('last_id')
-    amount -= 50
-
-    # fix this. continues updating even after collecting all the likers
-    with tqdm(total=likes_count, desc='Extracting Likers') as pbar:
-        while next_id and amount > 0:
-            number = min(amount, 50)
-
-            resp = self._get(
-                f'{ep.POST_v1}/{post_id}/likers?from_last_id={next_id}&number={number}')
-            users.extend(self.get_users_from_dict(resp))
-
-            next_id = resp.get('last_id')
-            amount -= 50
-
-            pbar.update(number)
-
-    return users
+    return collect(iter_likers(self, post_id, amount, resume=resume, keep_pages=True),
+                   amount, 'Extracting Likers')
 
 
 # ====== GROUP ======
 
 
 def get_group(self, group_id):
-    resp = self._get(f'{ep.GROUP_v1}/{group_id}')
-    group_data = resp.get('group')
+    group_data = self._cache_get('groups', group_id)
+    if group_data is None:
+        resp = self._get(f'{ep.GROUP_v1}/{group_id}')
+        group_data = resp.get('group')
+        self._cache_set('groups', group_id, group_data)
     return gen.group_object(self, group_data)
 
 
+def get_groups(self, group_ids, max_workers=None, return_exceptions=False):
+    return get_many(self, 'groups', self.get_group, gen.group_object,
+                    group_ids, max_workers, return_exceptions)
+
+
 def get_groups_from_dict(self, resp):
     assert 'groups' in resp, "'groups' key not found"
-    groups_data = resp.get('groups')
-    groups = []
-    for group_data in groups_data:
-        group = gen.group_object(self, group_data)
-        groups.append(group)
-    return groups
+    return gen.group_objects(self, resp.get('groups'))
 
 
 def get_group_users_from_dict(self, resp):
     assert 'group_users' in resp, "'group_users' key not found"
-    users_data = resp.get('group_users')
-    users = []
-    for user_data in users_data:
-        user = gen.group_user_object(self, user_data)
-        users.append(user)
-    return users
+    return gen.group_user_objects(self, resp.get('group_users'))
 
 
 def get_group_timeline(self, group_id, amount=100):
@@ -382,29 +503,22 @@ def get_banned_user_from_group(self, group_id, amount=100):
 
 
 def get_chat_room(self, chatroom_id):
-    resp = self._get(f'{ep.CHATROOM_v2}/{chatroom_id}')
-    chat_room_data = resp.get('chat')
+    chat_room_data = self._cache_get('chat_rooms', chatroom_id)
+    if chat_room_data is None:
+        resp = self._get(f'{ep.CHATROOM_v2}/{chatroom_id}')
+        chat_room_data = resp.get('chat')
+        self._cache_set('chat_rooms', chatroom_id, chat_room_data)
     return gen.chat_room_object(self, chat_room_data)
 
 
 def get_chat_rooms_from_dict(self, resp):
     assert 'chat_rooms' in resp, "'chat_rooms' key not found"
-    chat_rooms_data = resp.get('chat_rooms')
-    chats = []
-    for chat_room_data in chat_rooms_data:
-        chat = gen.chat_room_object(self, chat_room_data)
-        chats.append(chat)
-    return chats
+    return gen.chat_room_objects(self, resp.get('chat_rooms'))
 
 
 def get_chat_messages_from_dict(self, resp):
     assert 'messages' in resp, "'messages' key not found"
-    messages_data = resp.get('messages')
-    messages = []
-    for message_data in messages_data:
-        message = gen.message_object(self, message_data)
-        messages.append(message)
-    return messages
+    return gen.message_objects(self, resp.get('messages'))
 
 
 def get_chat_room_id_from_user(self, user_id) -> str:
@@ -442,12 +556,7 @@ def get_chat_requests(self, amount=None):
 
 def get_activities_from_dict(self, resp):
     assert 'activities' in resp, "'activities' key not found"
-    activities_data = resp.get('activities')
-    activities = []
-    for activity_data in activities_data:
-        activity = gen.activity_object(self, activity_data)
-        activities.append(activity)
-    return activities
+    return gen.activity_objects(self, resp.get('activities'))
 
 
 def get_notification(self, important=True, amount=100):
@@ -52,6 +52,7 @@ def delete_group(self, group_id):
     data = {'groupId': group_id}
     resp = self._delete(
         f'{ep.GROUP_v1}/{group_id}/leave', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
@@ -102,6 +103,7 @@ def change_group_settings(
     }
     resp = self._put(
         f'https://yay.space/api/groups/{group_id}', data)
+    self._cache_set('groups', group_id, resp.get('group'))
     return gen.group_object(self, resp.get('group'))
 
 
@@ -114,6 +116,7 @@ def transfer_group_ownership(self, group_id, user_id):
     }
     resp = self._post(
         f'https://yay.space/api/groups/{group_id}/transfer', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
@@ -123,6 +126,7 @@ def offer_group_sub_owner(self, group_id, user_id):
     data = {'uuid': '', 'user_ids[]': user_id}
     resp = self._post(
         f'https://yay.space/api/groups/{group_id}/deputize', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
@@ -130,18 +134,21 @@ def undo_group_ownership_transfer(self, group_id, user_id):
     data = {'user_id': user_id}
     resp = self._put(
         f'{ep.GROUP_v1}/{group_id}/transfer/withdraw', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
 def undo_group_sub_owner_offer(self, group_id, user_id):
     resp = self._put(
         f'{ep.GROUP_v1}/{group_id}/deputize/{user_id}/withdraw')
+    self._invalidate('groups', group_id)
     return resp
 
 
 def fire_group_sub_owner(self, group_id, user_id):
     resp = self._post(
         f'{ep.GROUP_v1}/{group_id}/fire/{user_id}')
+    self._invalidate('groups', group_id)
     return resp
 
 
@@ -153,6 +160,7 @@ def accept_group_join_request(self, group_id, user_id):
     }
     resp = self._post(
         f'{ep.GROUP_v1}/{group_id}/accept/{user_id}', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
@@ -164,6 +172,7 @@ def decline_group_join_request(self, group_id, user_id):
     }
     resp = self._post(
         f'{ep.GROUP_v1}/{group_id}/decline/{user_id}', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
@@ -171,6 +180,7 @@ def invite_user_to_group(self, group_id, user_id):
     data = {'user_ids[]': user_id}
     resp = self._post(
         f'{ep.GROUP_v1}/{group_id}/invite', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
@@ -178,6 +188,7 @@ def pin_group_post(self, group_id, post_id):
     data = {'group_id': group_id, 'post_id': post_id}
     resp = self._put(
         f'{ep.POST_v2}/group_pinned_post', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
@@ -185,23 +196,27 @@ def unpin_group_post(self, group_id):
     data = {'group_id': group_id}
     resp = self._delete(
         f'{ep.POST_v2}/group_pinned_post', data)
+    self._invalidate('groups', group_id)
     return resp
 
 
 def ban_user_from_group(self, group_id, user_id):
     resp = self._post(
         f'{ep.GROUP_v1}/{group_id}/ban/{user_id}')
+    self._invalidate('groups', group_id)
     return resp
 
 
 def unban_user_from_group(self, group_id, user_id):
     resp = self._post(
         f'{ep.GROUP_v1}/{group_id}/unban/{user_id}')
+    self._invalidate('groups', group_id)
     return resp
 
 
 def join_group(self, group_id):
     self._post(f'{ep.GROUP_v1}/{group_id}/join')
+    self._invalidate('groups', group_id)
     return self.get_group(group_id)
 
 
@@ -209,4 +224,5 @@ def leave_group(self, group_id):
     data = {'groupId': group_id}
     resp = self._delete(
         f'{ep.GROUP_v1}/{group_id}/leave', data)
+    self._invalidate('groups', group_id)
     return resp
@@ -0,0 +1,257 @@
+import functools
+import itertools
+import threading
+import time
+
+from ..exceptions import RateLimitError, ExceedCallQuotaError
+from .api import Yay
+from .api_request import RetryPolicy
+
+
+class PoolMember(object):
+
+    def __init__(self, yay):
+        self.yay = yay
+        self.in_flight = 0
+        self.calls = 0
+        self.errors = 0
+        self.sidelined = 0
+        self.sidelined_until = 0.0
+        self.busy_time = 0.0
+
+    @property
+    def name(self):
+        return getattr(self.yay, 'logged_in_as', None) or hex(id(self.yay))
+
+    def snapshot(self, now) -> dict:
+        return {
+            'account': self.name,
+            'in_flight': self.in_flight,
+            'calls': self.calls,
+            'errors': self.errors,
+            'sidelined': self.sidelined,
+            'cooldown': max(0.0, self.sidelined_until - now),
+            'busy_time': self.busy_time,
+        }
+
+
+class PooledYay(object):
+    # stands in for Yay inside a Paginator so that every page request
+    # goes through the pool, everything else comes from the original client
+
+    def __init__(self, pool, yay):
+        self._pool = pool
+        self._yay = yay
+
+    def __getattr__(self, name):
+        return getattr(self._yay, name)
+
+    def _get(self, url: str):
+        return self._pool.call(lambda yay: yay._get(url))
+
+    def _ensure_workers(self, workers: int):
+        for yay in self._pool.clients:
+            yay._ensure_workers(workers)
+
+    # the bulk getters fan out to these, so each id is sent by
+    # whichever account is free and a rate limited one is sidelined
+    def get_user(self, user_id: str, lite: bool = False):
+        return self._pool.call(lambda yay: yay.get_user(user_id, lite))
+
+    def get_post(self, post_id: str):
+        return self._pool.call(lambda yay: yay.get_post(post_id))
+
+    def get_group(self, group_id: str):
+        return self._pool.call(lambda yay: yay.get_group(group_id))
+
+
+class YayPool(object):
+
+    STRATEGIES = ('round_robin', 'least_loaded')
+    # run with PooledYay as self, so every request they send goes through call()
+    POOLED_GETTERS = (
+        'get_users', 'get_posts', 'get_groups',
+        'get_user_followers', 'get_user_followings', 'get_post_likers',
+        'get_letters', 'get_timeline', 'get_hima_users',
+    )
+
+    def __init__(self, clients, strategy: str = 'round_robin', cooldown: float = 60,
+                 max_attempts: int = 10):
+        """
+
+        YayPool
+        ---
+            ログイン済みの複数の Yay で読み取り系のメソッド (get_* / iter_*) を分担します。\n
+            RateLimitError か ExceedCallQuotaError になったアカウントは
+            クールダウンが終わるまで振り分けから外され、そのリクエストは別のアカウントで再送されます。
+            iter_* とページ送りで取得する get_* (get_user_followers など) はページごとに、
+            get_users / get_posts / get_groups はIDごとに振り分けられるため、
+            途中でレート制限になっても取得済みのページは失われません。\n
+            アカウント自身の RetryPolicy が RateLimitError で待ってしまわないよう、
+            RetryPolicy(retry_rate_limits=False) を指定した Yay を渡してください
+            (from_accounts はそのように作成します)。
+
+        Parameters:
+            clients (list): ログイン済みの Yay のリスト
+            strategy (str): 'round_robin' (順番) または 'least_loaded' (実行中が最も少ないアカウント)
+            cooldown (float): 振り分けから外す秒数 (Retry-After の方が長ければそちらを使います)
+            max_attempts (int): 1回のリクエストをアカウントを変えて試す最大回数 (超えるとエラーを送出します)
+
+        Examples:
+        >>> pool = YayPool.from_accounts([('mail1', 'pass1'), ('mail2', 'pass2')])
+        >>> users = pool.get_users(ids)
+        >>> pool.stats()
+
+        """
+        if not clients:
+            raise ValueError('YayPool needs at least one client')
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f'unknown strategy: {strategy}')
+        self.members = [PoolMember(yay) for yay in clients]
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.max_attempts = max_attempts
+        self.started_at = time.monotonic()
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_accounts(cls, accounts, strategy: str = 'round_robin', cooldown: float = 60,
+                      max_attempts: int = 10, **kwargs):
+        """(メールアドレス, パスワード) のリストからログイン済みの Yay を作成してプールにする (ログインに失敗したアカウントは除きます)"""
+        kwargs.setdefault('retry_policy', RetryPolicy(retry_rate_limits=False))
+        clients = []
+        for email, password in accounts:
+            yay = Yay(**kwargs)
+            if not yay.login(email, password):
+                yay.logger.warning(f'Login failed for {email}, left out of the pool')
+                yay.close()
+                continue
+            clients.append(yay)
+        return cls(clients, strategy, cooldown, max_attempts)
+
+    @property
+    def clients(self) -> list:
+        return [member.yay for member in self.members]
+
+    def __getattr__(self, name):
+        if not (name.startswith('get_') or name.startswith('iter_')):
+            raise AttributeError(
+                f"'YayPool' only routes get_* and iter_* calls, "
+                f"use YayPool.clients[i].{name} for '{name}'")
+        attr = getattr(self.members[0].yay, name)
+        if not callable(attr):
+            return attr
+
+        if name.startswith('iter_'):
+            @functools.wraps(attr)
+            def iterator(*args, **kwargs):
+                member = self._acquire()
+                try:
+                    paginator = getattr(member.yay, name)(*args, **kwargs)
+                finally:
+                    self._release(member)
+                paginator.yay = PooledYay(self, member.yay)
+                return paginator
+
+            return iterator
+
+        if name in self.POOLED_GETTERS:
+            @functools.wraps(attr)
+            def pooled(*args, **kwargs):
+                # the first client only lends its cache and settings, every
+                # id or page goes through call(), so a rate limited account
+                # hands over the rest instead of restarting the whole crawl
+                return getattr(Yay, name)(PooledYay(self, self.members[0].yay), *args, **kwargs)
+
+            return pooled
+
+        @functools.wraps(attr)
+        def method(*args, **kwargs):
+            return self.call(lambda yay: getattr(yay, name)(*args, **kwargs))
+
+        return method
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _available(self, now):
+        return [member for member in self.members if member.sidelined_until <= now]
+
+    def _acquire(self) -> PoolMember:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                available = self._available(now)
+                if available:
+                    break
+                # every account is cooling down, wait for the first to come back
+                self._cond.wait(min(member.sidelined_until for member in self.members) - now)
+            if self.strategy == 'least_loaded':
+                member = min(available, key=lambda m: (m.in_flight, m.calls))
+            else:
+                member = available[next(self._order) % len(available)]
+            member.in_flight += 1
+            member.calls += 1
+            return member
+
+    def _release(self, member, busy_time=0.0, error=None):
+        with self._cond:
+            member.in_flight -= 1
+            member.busy_time += busy_time
+            if error is not None:
+                member.errors += 1
+                if isinstance(error, (RateLimitError, ExceedCallQuotaError)):
+                    wait = max(self.cooldown, getattr(error, 'retry_after', None) or 0)
+                    member.sidelined_until = time.monotonic() + wait
+                    member.sidelined += 1
+            self._cond.notify_all()
+
+    def call(self, func):
+        """func(yay) をいずれかのアカウントで実行する (max_attempts 回レート制限になるとエラーを送出)"""
+        attempt = 0
+        while True:
+            attempt += 1
+            member = self._acquire()
+            started = time.monotonic()
+            try:
+                result = func(member.yay)
+            except (RateLimitError, ExceedCallQuotaError) as e:
+                self._release(member, time.monotonic() - started, e)
+                if attempt >= self.max_attempts:
+                    raise
+                # retried on the next account that is not cooling down
+                member.yay.logger.warning(
+                    f'{type(e).__name__} on {member.name}, '
+                    f'sidelined for {max(0.0, member.sidelined_until - time.monotonic()):.0f}s')
+                continue
+            except Exception as e:
+                self._release(member, time.monotonic() - started, e)
+                raise
+            self._release(member, time.monotonic() - started)
+            return result
+
+    def stats(self) -> dict:
+        """プール全体とアカウントごとの呼び出し数・エラー数などを返す"""
+        with self._cond:
+            now = time.monotonic()
+            members = [member.snapshot(now) for member in self.members]
+            calls = sum(member.calls for member in self.members)
+            elapsed = now - self.started_at
+            return {
+                'accounts': len(self.members),
+                'available': len(self._available(now)),
+                'in_flight': sum(member.in_flight for member in self.members),
+                'calls': calls,
+                'errors': sum(member.errors for member in self.members),
+                'sidelined': sum(member.sidelined for member in self.members),
+                'calls_per_second': calls / elapsed if elapsed > 0 else 0.0,
+                'members': members,
+            }
+
+    def close(self):
+        for member in self.members:
+            member.yay.close()
@@ -1,5 +1,5 @@
 from ..config import Endpoints as ep
-from ..utils import console_print
+from ..utils import BATCH_SIZE, console_print, post_batches
 
 
 # post_type -> text, questionaire, image, video, call, video call
@@ -17,6 +17,7 @@ def create_post(self, text, color=0, font_size=0, choices=None):
         resp = self._post('https://yay.space/api/posts', data)
     else:
         resp = self._post(f'{ep.API_URL}/v1/web/posts/new', data)
+    self._invalidate('users', getattr(self, 'logged_in_as', None))
     return resp
 
 
@@ -30,6 +31,8 @@ def create_post_in_group(self, group_id, text, color=0, font_size=0, choices=Non
         'uuid': ''
     }
     resp = self._post('https://yay.space/api/posts', data)
+    self._invalidate('users', getattr(self, 'logged_in_as', None))
+    self._invalidate('groups', group_id)
     return self.get_post(resp['id'])
 
 
@@ -45,6 +48,7 @@ def create_repost(self, text, post_id, color=0, font_size=0):
     }
     resp = self._post(
         f'{ep.POST_v3}/repost', data)
+    self._invalidate('posts', post_id)
     return resp
 
 
@@ -57,6 +61,7 @@ def create_reply(self, text, post_id, color=0, font_size=0):
     }
     resp = self._post(
         f'{ep.API_URL}/v1/web/posts/new', data)
+    self._invalidate('posts', post_id)
     return resp
 
 
@@ -64,19 +69,31 @@ def delete_post(self, post_id):
     data = {'posts_ids[]': post_id}
     resp = self._post(
         f'{ep.POST_v2}/mass_destroy', data)
+    self._invalidate('posts', post_id)
+    self._invalidate('users', getattr(self, 'logged_in_as', None))
     return resp
 
 
+def delete_posts(self, post_ids, batch_size=BATCH_SIZE):
+    try:
+        return post_batches(
+            self, f'{ep.POST_v2}/mass_destroy', 'posts_ids[]', post_ids, batch_size, 'posts')
+    finally:
+        self._invalidate('users', getattr(self, 'logged_in_as', None))
+
+
 def pin_post(self, post_id):
     data = {'id': post_id}
     resp = self._post(
         f'{ep.PIN_v1}/posts', data)
+    self._invalidate('posts', post_id)
     return resp
 
 
 def unpin_post(self, post_id):
     resp = self._post(
         f'{ep.PIN_v1}/posts/{post_id}')
+    self._invalidate('posts', post_id)
     return resp
 
 
@@ -84,10 +101,17 @@ def like_post(self, post_id):
     data = {'post_ids': post_id}
     resp = self._post(
         f'{ep.POST_v2}/like', data)
+    self._invalidate('posts', post_id)
     return resp
 
 
+def like_posts(self, post_ids, batch_size=BATCH_SIZE):
+    return post_batches(
+        self, f'{ep.POST_v2}/like', 'post_ids[]', post_ids, batch_size, 'posts')
+
+
 def unlike_post(self, post_id):
     resp = self._post(
         f'{ep.POST_v1}/{post_id}/unlike')
+    self._invalidate('posts', post_id)
     return resp
@@ -0,0 +1,129 @@
+import random
+import time
+
+from ..exceptions import AuthenticationError, RateLimitError, ServerError
+from ..utils import handle_response
+
+
+class RetryPolicy(object):
+
+    def __init__(
+            self,
+            max_attempts: int = 5,
+            backoff: float = 0.5,
+            max_backoff: float = 60,
+            deadline: float = 300,
+            retry_methods=('GET', 'PUT', 'DELETE'),
+            retry_rate_limits: bool = True,
+    ):
+        """
+
+        RetryPolicy
+        ---
+            失敗したリクエストを指数バックオフ(ジッター付き)で再試行します。\n
+            RateLimitErrorはどのメソッドでも再試行し、Retry-Afterがあればその秒数だけ待ちます。
+            タイムアウト・接続エラー・5xxは、二重に実行されても安全な retry_methods のみ再試行します。
+
+        Parameters:
+            max_attempts (int): 最初の1回を含む最大試行回数 (1で再試行しない)
+            backoff (float): 1回目の再試行までの待ち時間の上限(秒)、以降は2倍ずつ増えます
+            max_backoff (float): 1回あたりの待ち時間の上限(秒)
+            deadline (float): 最初の試行からの合計時間の上限(秒)
+            retry_methods (tuple): 通信エラーや5xxで再試行するHTTPメソッド
+            retry_rate_limits (bool): FalseにするとRateLimitErrorを再試行せずにすぐ送出します (YayPool用)
+
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_methods = retry_methods
+        self.retry_rate_limits = retry_rate_limits
+
+    def is_retryable(self, method: str, error: Exception) -> bool:
+        if isinstance(error, RateLimitError):
+            return self.retry_rate_limits
+        import requests
+
+        if isinstance(error, (ServerError, requests.Timeout, requests.ConnectionError)):
+            return method in self.retry_methods
+        return False
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            return retry_after
+        # full jitter: anywhere between 0 and the exponential backoff
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+
+def request(self, method: str, url: str, data: dict = None):
+    policy = self.retry_policy
+    controller = self.concurrency
+    proxy_pool = self.proxy_pool
+    metrics = self.metrics
+    started = time.monotonic()
+    attempt = 0
+    refreshed = False
+
+    while True:
+        attempt += 1
+        # the token seen to expire, so threads queued behind the one that
+        # refreshes it reuse the new token instead of refreshing again
+        token = self.auth.access_token
+        if self.auth.needs_refresh():
+            self._refresh_token(token)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        if controller is not None:
+            controller.acquire()
+        if proxy_pool is not None:
+            # the same account keeps the same egress ip while it is healthy
+            proxy = proxy_pool.acquire(self.auth.proxy_key)
+            session, proxies = proxy.session, proxy.proxies
+        else:
+            session, proxies = self.auth.session, self.auth.proxies
+        sent_at = time.monotonic()
+        token = self.auth.access_token
+        resp = None
+        try:
+            resp = session.request(
+                method, url, params=data,
+                headers=self.auth.headers,
+                proxies=proxies,
+                timeout=self.auth.timeout)
+            result = handle_response(resp)
+
+        except Exception as e:
+            if controller is not None:
+                controller.release(time.monotonic() - sent_at, e)
+            if proxy_pool is not None:
+                proxy_pool.release(proxy, time.monotonic() - sent_at, e)
+            if metrics is not None:
+                metrics.record(method, url, time.monotonic() - sent_at, resp, e)
+            # an expired token is refreshed once and the request sent again
+            if isinstance(e, AuthenticationError):
+                if not refreshed and self._refresh_token(token):
+                    refreshed = True
+                    attempt -= 1
+                    continue
+                # the saved tokens are dead, don't restore them on the next login()
+                self.auth.forget()
+            if attempt >= policy.max_attempts or not policy.is_retryable(method, e):
+                raise
+            delay = policy.delay(attempt, e)
+            if time.monotonic() - started + delay > policy.deadline:
+                raise
+            self.logger.warning(
+                f'{type(e).__name__} on {method} {url}, '
+                f'retrying in {delay:.1f}s ({attempt}/{policy.max_attempts})')
+            time.sleep(delay)
+
+        else:
+            if controller is not None:
+                controller.release(time.monotonic() - sent_at)
+            if proxy_pool is not None:
+                proxy_pool.release(proxy, time.monotonic() - sent_at)
+            if metrics is not None:
+                metrics.record(method, url, time.monotonic() - sent_at, resp)
+            return result
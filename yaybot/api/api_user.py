@@ -4,23 +4,27 @@ from ..utils import console_print
 
 def follow_user(self, user_id):
     resp = self._post(f'{ep.USER_v2}/{user_id}/follow')
+    self._invalidate('users', user_id, getattr(self, 'logged_in_as', None))
     return resp
 
 
 def unfollow_user(self, user_id):
     resp = self._post(f'{ep.USER_v2}/{user_id}/unfollow')
+    self._invalidate('users', user_id, getattr(self, 'logged_in_as', None))
     return resp
 
 
 def accept_follow_request(self, user_id):
     resp = self._post(
         f'{ep.USER_v2}/{user_id}/follow_request?action=accept')
+    self._invalidate('users', user_id, getattr(self, 'logged_in_as', None))
     return resp
 
 
 def reject_follow_request(self, user_id):
     resp = self._post(
         f'{ep.USER_v2}/{user_id}/follow_request?action=reject')
+    self._invalidate('users', user_id, getattr(self, 'logged_in_as', None))
     return resp
 
 
@@ -28,16 +32,19 @@ def send_letter(self, user_id, message):
     data = {'comment': message}
     resp = self._post(
         f'{ep.USER_v1}/reviews/{user_id}', data)
+    self._invalidate('users', user_id)
     return resp
 
 
 def block_user(self, user_id):
     resp = self._post(
         f'{ep.USER_v1}/{user_id}/block')
+    self._invalidate('users', user_id, getattr(self, 'logged_in_as', None))
     return resp
 
 
 def unblock_user(self, user_id):
     resp = self._post(
         f'{ep.USER_v1}/{user_id}/unblock')
+    self._invalidate('users', user_id, getattr(self, 'logged_in_as', None))
     return resp
@@ -0,0 +1,9 @@
+from .api_cashe import YayCache, SQLiteCache
+from .api_concurrency import AdaptiveConcurrency
+from .api_credentials import YayCredentials
+from .api_limiter import RateLimiter
+from .api_metrics import YayMetrics
+from .api_proxy import ProxyPool
+from .api_state import YayState
+
+__all__ = ['YayCache', 'SQLiteCache', 'AdaptiveConcurrency', 'YayCredentials', 'ProxyPool', 'RateLimiter', 'YayMetrics', 'YayState']
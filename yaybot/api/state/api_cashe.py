@@ -0,0 +1,237 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+
+from ...utils import json_loads
+
+
+# seconds each kind of payload stays fresh
+DEFAULT_TTLS = {
+    'users': 300,
+    'posts': 60,
+    'groups': 300,
+    'chat_rooms': 30,
+}
+
+
+class YayCache(object):
+
+    def __init__(self, maxsize: int = 10000, ttl: int = 300, ttls: dict = None):
+        """
+
+        YayCache
+        ---
+            APIのレスポンスを保持するメモリ上のキャッシュです。\n
+            エンドポイントごとに有効期限(秒)を設定でき、
+            maxsizeを超えると最も古く使われたものから削除されます。
+
+        Parameters:
+            maxsize (int): 保持する最大件数
+            ttl (int): ttlsに含まれないエンドポイントの有効期限
+            ttls (dict): エンドポイントごとの有効期限 (例: {'users': 60})
+
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, endpoint: str, key):
+        cache_key = (endpoint, str(key))
+        with self._lock:
+            item = self._data.get(cache_key)
+            if item is not None and item[0] < time.monotonic():
+                del self._data[cache_key]
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(cache_key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, endpoint: str, key, value):
+        cache_key = (endpoint, str(key))
+        expires_at = time.monotonic() + self.ttls.get(endpoint, self.ttl)
+        with self._lock:
+            self._data[cache_key] = (expires_at, value)
+            self._data.move_to_end(cache_key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str, key=None):
+        # drops one entry, or every entry of the endpoint if key is None
+        with self._lock:
+            if key is not None:
+                self._data.pop((endpoint, str(key)), None)
+                return
+            for cache_key in [k for k in self._data if k[0] == endpoint]:
+                del self._data[cache_key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+class SQLiteCache(object):
+
+    def __init__(self, path: str, maxsize: int = 100000, ttl: int = 86400, ttls: dict = None):
+        """
+
+        SQLiteCache
+        ---
+            APIのレスポンス(JSON)をSQLiteに保存するキャッシュです。\n
+            プロセスを再起動しても有効期限内のデータはそのまま使われます。
+
+        Parameters:
+            path (str): データベースファイルのパス
+            maxsize (int): 保持する最大件数
+            ttl (int): ttlsに含まれないエンドポイントの有効期限
+            ttls (dict): エンドポイントごとの有効期限 (例: {'users': 3600})
+
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writes = 0
+        # access times of hits, written in batches instead of on every get
+        self._accessed = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'endpoint TEXT NOT NULL, '
+            'key TEXT NOT NULL, '
+            'value TEXT NOT NULL, '
+            'expires_at REAL NOT NULL, '
+            'accessed_at REAL NOT NULL, '
+            'PRIMARY KEY (endpoint, key))'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)')
+        self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    def get(self, endpoint: str, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM cache WHERE endpoint = ? AND key = ? AND expires_at > ?',
+                (endpoint, str(key), now)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._accessed[(endpoint, str(key))] = now
+            if len(self._accessed) >= 1000:
+                self._flush_accessed()
+                self._conn.commit()
+            self.hits += 1
+        return json_loads(row[0])
+
+    def set(self, endpoint: str, key, value):
+        now = time.time()
+        expires_at = now + self.ttls.get(endpoint, self.ttl)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)',
+                (endpoint, str(key), json.dumps(value), expires_at, now)
+            )
+            self._accessed.pop((endpoint, str(key)), None)
+            self._writes += 1
+            # enforcing the size cap needs a full count, so only do it periodically
+            if self._writes % 100 == 0:
+                self._prune(now)
+            self._conn.commit()
+
+    def _flush_accessed(self):
+        if self._accessed:
+            self._conn.executemany(
+                'UPDATE cache SET accessed_at = ? WHERE endpoint = ? AND key = ?',
+                [(accessed_at, endpoint, key)
+                 for (endpoint, key), accessed_at in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+    def _prune(self, now):
+        # the pending access times decide which entries are least recently used
+        self._flush_accessed()
+        self._conn.execute('DELETE FROM cache WHERE expires_at <= ?', (now,))
+        size = self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+        if size > self.maxsize:
+            self._conn.execute(
+                'DELETE FROM cache WHERE rowid IN '
+                '(SELECT rowid FROM cache ORDER BY accessed_at LIMIT ?)',
+                (size - self.maxsize,)
+            )
+            self.evictions += size - self.maxsize
+
+    def invalidate(self, endpoint: str, key=None):
+        # drops one entry, or every entry of the endpoint if key is None
+        with self._lock:
+            if key is not None:
+                self._conn.execute(
+                    'DELETE FROM cache WHERE endpoint = ? AND key = ?', (endpoint, str(key)))
+                self._accessed.pop((endpoint, str(key)), None)
+            else:
+                self._conn.execute(
+                    'DELETE FROM cache WHERE endpoint = ?', (endpoint,))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM cache')
+            self._accessed.clear()
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._prune(time.time())
+            self._conn.commit()
+            self._conn.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+            return {
+                'size': size,
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from ...exceptions import RateLimitError, ExceedCallQuotaError
+
+
+class AdaptiveConcurrency(object):
+
+    def __init__(
+            self,
+            initial: int = 4,
+            min_limit: int = 1,
+            max_limit: int = 64,
+            increase: float = 1,
+            decrease: float = 0.5,
+            latency_factor: float = 3.0,
+            cooldown: float = 1.0,
+    ):
+        """
+
+        AdaptiveConcurrency
+        ---
+            同時に実行するリクエストの数をAIMDで自動調整します。\n
+            成功が続くと上限を少しずつ上げ(加算)、RateLimitError・ExceedCallQuotaError、
+            もしくは平均の latency_factor 倍を超える遅延が起きると上限を一気に下げます(乗算)。
+
+        Parameters:
+            initial (int): 最初の上限
+            min_limit (int): 上限の最小値
+            max_limit (int): 上限の最大値
+            increase (float): 上限の数だけ成功するごとに増やす量
+            decrease (float): 失敗したときに上限に掛ける値
+            latency_factor (float): 遅延とみなす平均応答時間の倍率 (Noneで無効)
+            cooldown (float): 続けて上限を下げない時間(秒)
+
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.latency = None
+        self.successes = 0
+        self.decreases = 0
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self._samples = 0
+        self._decreased_at = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self._limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency: float = None, error: Exception = None):
+        with self._cond:
+            self.in_flight -= 1
+            if isinstance(error, (RateLimitError, ExceedCallQuotaError)):
+                self._decrease()
+            elif error is None and latency is not None:
+                if self._is_spike(latency):
+                    self._decrease()
+                else:
+                    self.successes += 1
+                    self._limit = min(
+                        self.max_limit, self._limit + self.increase / self._limit)
+                self._samples += 1
+                self.latency = latency if self.latency is None else (
+                    0.9 * self.latency + 0.1 * latency)
+            self._cond.notify_all()
+
+    def _is_spike(self, latency):
+        # needs a few samples before the average means anything
+        return (self.latency_factor is not None and self._samples >= 20
+                and latency > self.latency * self.latency_factor)
+
+    def _decrease(self):
+        # requests already in flight fail together, count them as one signal
+        now = time.monotonic()
+        if now - self._decreased_at < self.cooldown:
+            return
+        self._decreased_at = now
+        self._limit = max(self.min_limit, self._limit * self.decrease)
+        self.decreases += 1
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'in_flight': self.in_flight,
+                'latency': self.latency,
+                'successes': self.successes,
+                'decreases': self.decreases,
+            }
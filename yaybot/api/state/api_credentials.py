@@ -0,0 +1,69 @@
+import json
+import os
+import threading
+import time
+
+
+class YayCredentials(object):
+
+    def __init__(self, path: str):
+        """
+
+        YayCredentials
+        ---
+            ログインで得たトークンとapi_keyをメールアドレスごとにファイルへ保存します。\n
+            次回以降の login() ではページの取得とログインを行わずに保存済みのトークンを使い、
+            期限切れの場合は refresh_token で更新します。
+
+        Parameters:
+            path (str): 保存先のJSONファイルのパス (所有者のみ読み書き可能な権限で作成されます)
+
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._accounts = None
+
+    def _read(self):
+        if self._accounts is None:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._accounts = json.load(f)
+            else:
+                self._accounts = {}
+        return self._accounts
+
+    def _write(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        # the file holds live tokens, so create it readable by the owner only
+        tmp_path = self.path + '.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self._accounts, f)
+        os.replace(tmp_path, self.path)
+
+    def load(self, email: str) -> dict:
+        with self._lock:
+            return self._read().get(email)
+
+    def save(self, email: str, access_token, refresh_token, expires_at, api_key, user_id):
+        with self._lock:
+            self._read()[email] = {
+                'access_token': access_token,
+                'refresh_token': refresh_token,
+                'expires_at': expires_at,
+                'api_key': api_key,
+                'user_id': user_id,
+                'updated_at': time.time(),
+            }
+            self._write()
+
+    def remove(self, email: str):
+        with self._lock:
+            if self._read().pop(email, None) is not None:
+                self._write()
+
+    def accounts(self) -> list:
+        with self._lock:
+            return list(self._read())
@@ -0,0 +1,111 @@
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+from ...config import Endpoints as ep
+
+
+# first path segment that tells which family an endpoint belongs to
+FAMILY_SEGMENTS = {
+    'users': 'users',
+    'posts': 'posts',
+    'pinned': 'posts',
+    'conversations': 'posts',
+    'groups': 'groups',
+    'chat_rooms': 'chat_rooms',
+}
+
+
+def endpoint_family(url: str) -> str:
+    parts = urlsplit(url)
+    if parts.netloc == ep.CAS_DOMAIN:
+        return 'cas'
+    for segment in parts.path.split('/'):
+        if segment in FAMILY_SEGMENTS:
+            return FAMILY_SEGMENTS[segment]
+    return 'default'
+
+
+class TokenBucket(object):
+
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.burst = max(1.0, rate) if burst is None else burst
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+        self.waits = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            # take the token now and sleep off the debt outside the lock,
+            # so waiting callers are served in order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+            if wait:
+                self.waits += 1
+                self.waited += wait
+        if wait:
+            time.sleep(wait)
+
+
+class RateLimiter(object):
+
+    def __init__(self, rates: dict = None, default=None):
+        """
+
+        RateLimiter
+        ---
+            エンドポイントの種類ごとのトークンバケットで、リクエストの送信ペースを制御します。\n
+            種類は users, posts, groups, chat_rooms, cas と、それ以外の default です。
+            複数のスレッドやYayインスタンスで共有できます。
+
+        Parameters:
+            rates (dict): 種類ごとの 1秒あたりのリクエスト数、
+                もしくは (1秒あたりのリクエスト数, 連続で送れる数)
+            default: ratesに含まれない種類に使う値 (Noneの場合は制限しない)
+
+        Examples:
+        >>> RateLimiter({'users': 5, 'posts': (2, 10)}, default=10)
+
+        """
+        self.buckets = {}
+        for family, rate in (rates or {}).items():
+            self.buckets[family] = self._bucket(rate)
+        self.default = default
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket(rate):
+        if isinstance(rate, (tuple, list)):
+            return TokenBucket(*rate)
+        return TokenBucket(rate)
+
+    def acquire(self, url: str):
+        family = endpoint_family(url)
+        bucket = self.buckets.get(family)
+        if bucket is None:
+            if self.default is None:
+                return
+            with self._lock:
+                bucket = self.buckets.get(family)
+                if bucket is None:
+                    bucket = self.buckets[family] = self._bucket(self.default)
+        bucket.acquire()
+
+    def stats(self) -> dict:
+        return {
+            family: {
+                'rate': bucket.rate,
+                'burst': bucket.burst,
+                'waits': bucket.waits,
+                'waited': bucket.waited,
+            }
+            for family, bucket in self.buckets.items()
+        }
@@ -0,0 +1,238 @@
+import bisect
+import functools
+import json
+import threading
+
+from urllib.parse import urlsplit
+
+
+# upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+# segments followed by free text in the path, e.g. /v2/posts/tags/{tag};
+# each value would otherwise become a series of its own
+FREE_TEXT_SEGMENTS = {
+    'tags': '{tag}',
+    'search': '{keyword}',
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def endpoint_template(url: str) -> str:
+    # https://api.yay.space/v2/users/123/web_followers?number=50
+    # -> /v2/users/{id}/web_followers
+    segments = urlsplit(url).path.split('/')
+    template = []
+    for i, segment in enumerate(segments):
+        if segment.isdigit():
+            segment = '{id}'
+        elif i > 0 and segments[i - 1] in FREE_TEXT_SEGMENTS:
+            segment = FREE_TEXT_SEGMENTS[segments[i - 1]]
+        template.append(segment)
+    return '/'.join(template)
+
+
+def escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class EndpointStats(object):
+
+    def __init__(self, buckets):
+        self.count = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.bytes = 0
+        self.statuses = {}
+        self.exceptions = {}
+
+    def snapshot(self, buckets) -> dict:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'latency_sum': self.latency_sum,
+            'latency_avg': self.latency_sum / self.count if self.count else 0.0,
+            'latency_buckets': dict(zip([str(b) for b in buckets] + ['+Inf'], self.bucket_counts)),
+            'bytes': self.bytes,
+            'statuses': dict(self.statuses),
+            'exceptions': dict(self.exceptions),
+        }
+
+
+class YayMetrics(object):
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+
+        YayMetrics
+        ---
+            エンドポイントごとのリクエスト数・レイテンシ・レスポンスのサイズ・
+            ステータスコード・発生した例外を記録します。\n
+            エンドポイントはURLの数字の部分を {id} に置き換えたパスで集計されます
+            (例: /v2/users/{id}/web_followers)。\n
+            snapshot() で dict として、prometheus() で Prometheus のテキスト形式で取得でき、
+            serve() でローカルのHTTPサーバーから公開できます。\n
+            watch_concurrency() で登録した AdaptiveConcurrency の上限と実行中の数も
+            prometheus() にゲージとして含まれます (Yay(concurrency=..., metrics=...) では自動で登録)。
+
+        Parameters:
+            buckets (tuple): レイテンシのヒストグラムの境界(秒)
+
+        Examples:
+        >>> yay = Yay(metrics=True)
+        >>> yay.metrics.serve(9108)  # http://127.0.0.1:9108/metrics
+
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.endpoints = {}
+        # AdaptiveConcurrency controllers exported as gauges
+        self.controllers = []
+        self._lock = threading.Lock()
+        self._server = None
+
+    def record(self, method: str, url: str, latency: float, resp=None, error=None):
+        """1回のリクエストの結果を記録する (resp が無いのは通信エラーの場合)"""
+        key = (method, endpoint_template(url))
+        status = getattr(resp, 'status_code', None)
+        size = len(resp.content or b'') if resp is not None else 0
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats(self.buckets)
+            stats.count += 1
+            stats.latency_sum += latency
+            # first bucket whose bound is >= latency, the last one is +Inf
+            stats.bucket_counts[bisect.bisect_left(self.buckets, latency)] += 1
+            stats.bytes += size
+            if status is not None:
+                stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if error is not None:
+                stats.errors += 1
+                name = type(error).__name__
+                stats.exceptions[name] = stats.exceptions.get(name, 0) + 1
+
+    def watch_concurrency(self, controller):
+        """AdaptiveConcurrency の上限と実行中の数を prometheus() に含める"""
+        with self._lock:
+            if not any(watched is controller for watched in self.controllers):
+                self.controllers.append(controller)
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
+
+    def snapshot(self) -> dict:
+        """{'GET /v2/users/{id}': {...}, ...} の形で集計を返す"""
+        with self._lock:
+            return {
+                f'{method} {endpoint}': stats.snapshot(self.buckets)
+                for (method, endpoint), stats in sorted(self.endpoints.items())
+            }
+
+    def prometheus(self) -> str:
+        """集計を Prometheus のテキスト形式で返す"""
+        with self._lock:
+            items = sorted(self.endpoints.items())
+            requests, durations, sizes, exceptions = [], [], [], []
+            for (method, endpoint), stats in items:
+                labels = f'method="{escape_label(method)}",endpoint="{escape_label(endpoint)}"'
+                for status, count in sorted(stats.statuses.items()):
+                    requests.append(f'yaybot_requests_total{{{labels},status="{status}"}} {count}')
+                no_response = stats.count - sum(stats.statuses.values())
+                if no_response:
+                    requests.append(f'yaybot_requests_total{{{labels},status="none"}} {no_response}')
+                cumulative = 0
+                for bound, count in zip(self.buckets, stats.bucket_counts):
+                    cumulative += count
+                    durations.append(
+                        f'yaybot_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                durations.append(
+                    f'yaybot_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+                durations.append(f'yaybot_request_duration_seconds_sum{{{labels}}} {stats.latency_sum}')
+                durations.append(f'yaybot_request_duration_seconds_count{{{labels}}} {stats.count}')
+                sizes.append(f'yaybot_response_bytes_total{{{labels}}} {stats.bytes}')
+                for name, count in sorted(stats.exceptions.items()):
+                    exceptions.append(
+                        f'yaybot_exceptions_total{{{labels},exception="{escape_label(name)}"}} {count}')
+            controllers = list(self.controllers)
+
+        limits, in_flight, decreases = [], [], []
+        for i, controller in enumerate(controllers):
+            state = controller.snapshot()
+            labels = f'controller="{i}"'
+            limits.append(f'yaybot_concurrency_limit{{{labels}}} {state["limit"]}')
+            in_flight.append(f'yaybot_concurrency_in_flight{{{labels}}} {state["in_flight"]}')
+            decreases.append(f'yaybot_concurrency_decreases_total{{{labels}}} {state["decreases"]}')
+
+        lines = [
+            '# HELP yaybot_requests_total Requests sent, by endpoint and status code.',
+            '# TYPE yaybot_requests_total counter',
+            *requests,
+            '# HELP yaybot_request_duration_seconds Request latency, by endpoint.',
+            '# TYPE yaybot_request_duration_seconds histogram',
+            *durations,
+            '# HELP yaybot_response_bytes_total Response body bytes received, by endpoint.',
+            '# TYPE yaybot_response_bytes_total counter',
+            *sizes,
+            '# HELP yaybot_exceptions_total Exceptions raised, by endpoint and type.',
+            '# TYPE yaybot_exceptions_total counter',
+            *exceptions,
+        ]
+        if controllers:
+            lines += [
+                '# HELP yaybot_concurrency_limit Requests the adaptive controller lets run at once.',
+                '# TYPE yaybot_concurrency_limit gauge',
+                *limits,
+                '# HELP yaybot_concurrency_in_flight Requests currently admitted by the controller.',
+                '# TYPE yaybot_concurrency_in_flight gauge',
+                *in_flight,
+                '# HELP yaybot_concurrency_decreases_total Times the controller lowered its limit.',
+                '# TYPE yaybot_concurrency_decreases_total counter',
+                *decreases,
+            ]
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int = 9108, host: str = '127.0.0.1'):
+        """
+        /metrics (Prometheus) と /metrics.json (snapshot) を返すHTTPサーバーを
+        バックグラウンドのスレッドで起動する
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body = metrics.prometheus().encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+                elif self.path == '/metrics.json':
+                    body = json.dumps(metrics.snapshot()).encode('utf-8')
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.close()
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name='yaybot-metrics', daemon=True).start()
+        return self._server
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
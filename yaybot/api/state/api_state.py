@@ -0,0 +1,119 @@
+import json
+import os
+import re
+import threading
+import time
+
+
+# clients on the same base_path share the lock of their state file
+_path_locks = {}
+_path_locks_lock = threading.Lock()
+
+
+def path_lock(path):
+    path = os.path.abspath(path)
+    with _path_locks_lock:
+        return _path_locks.setdefault(path, threading.Lock())
+
+
+class YayState(object):
+
+    def __init__(self, path: str):
+        """
+
+        YayState
+        ---
+            ページ送りの途中経過(カーソルと取得済みの件数)をファイルに保存します。\n
+            (エンドポイント, 対象のID) ごとに最後に処理し終えたページが記録され、
+            resume=True で取得を再開できます。
+            リストを返す get_* では処理済みのページも pages_dir に保存され、
+            再開時にはそのページから順に返されます。\n
+            同じファイルを使う複数の YayState は書き込みのたびにファイルを読み直すため、
+            お互いの途中経過を消しません。
+
+        Parameters:
+            path (str): 保存先のJSONファイルのパス
+
+        """
+        self.path = path
+        # pages kept for resume=True list getters, one JSONL file per checkpoint
+        self.pages_dir = os.path.splitext(path)[0] + '_pages'
+        self._lock = path_lock(path)
+
+    @staticmethod
+    def _key(endpoint, target_id):
+        return f'{endpoint}:{target_id if target_id is not None else ""}'
+
+    def _read(self):
+        # always from disk, another client may have written in the meantime
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write(self, checkpoints):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        # write to a temporary file first so a crash never leaves half a file
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoints, f)
+        os.replace(tmp_path, self.path)
+
+    def _pages_path(self, endpoint, target_id):
+        name = re.sub(r'[^\w.-]', '_', self._key(endpoint, target_id))
+        return os.path.join(self.pages_dir, name + '.jsonl')
+
+    def load(self, endpoint: str, target_id=None) -> dict:
+        with self._lock:
+            return self._read().get(self._key(endpoint, target_id))
+
+    def save(self, endpoint: str, target_id, cursor, collected: int, pages: int = None):
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[self._key(endpoint, target_id)] = {
+                'cursor': cursor,
+                'collected': collected,
+                'pages': pages,
+                'updated_at': time.time(),
+            }
+            self._write(checkpoints)
+
+    def append_page(self, endpoint: str, target_id, items: list):
+        """処理済みのページ (APIのレスポンスのリスト) を追記する"""
+        path = self._pages_path(endpoint, target_id)
+        with self._lock:
+            if not os.path.exists(self.pages_dir):
+                os.makedirs(self.pages_dir)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(items, ensure_ascii=False) + '\n')
+
+    def load_pages(self, endpoint: str, target_id, count: int) -> list:
+        """保存済みのページを先頭から count ページ分返す"""
+        path = self._pages_path(endpoint, target_id)
+        with self._lock:
+            if not count or not os.path.exists(path):
+                return []
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            # a page written after the last checkpoint was never confirmed
+            # (or is cut off), it is fetched again from the saved cursor
+            if len(lines) > count or (lines and not lines[-1].endswith('\n')):
+                lines = lines[:count]
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.writelines(line for line in lines if line.endswith('\n'))
+            return [json.loads(line) for line in lines if line.endswith('\n')]
+
+    def remove(self, endpoint: str, target_id=None):
+        with self._lock:
+            checkpoints = self._read()
+            if checkpoints.pop(self._key(endpoint, target_id), None) is not None:
+                self._write(checkpoints)
+            path = self._pages_path(endpoint, target_id)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def checkpoints(self) -> dict:
+        with self._lock:
+            return self._read()
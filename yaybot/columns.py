@@ -0,0 +1,308 @@
+import operator
+import sys
+
+from array import array
+from itertools import compress
+
+from .utils import path_getter, USER_FIELDS, POST_FIELDS
+
+
+# stored in integer columns when the api returns null or a non integer,
+# Columns.valid marks those rows so they never match a comparison
+MISSING = -1
+
+# column name -> typecode ('q' int64, 'b' int8 for flags, 'str' interned list);
+# the api path of each column comes from the model field maps in utils
+USER_COLUMN_TYPES = {
+    'id': 'q',
+    'screen_name': 'str',
+    'num_followers': 'q',
+    'num_followings': 'q',
+    'num_posts': 'q',
+    'num_joined_groups': 'q',
+    'num_reviews': 'q',
+    'private_user': 'b',
+    'verified_age': 'b',
+    'is_vip': 'b',
+    'country_code': 'str',
+    'prefecture': 'str',
+    'gender': 'q',
+    'generation': 'q',
+    'created_at': 'q',
+    'last_logged_in_at': 'q',
+    'new_user': 'b',
+}
+
+POST_COLUMN_TYPES = {
+    'id': 'q',
+    'author_id': 'q',
+    'author_screen_name': 'str',
+    'text': 'str',
+    'group_id': 'q',
+    'type': 'str',
+    'num_likes': 'q',
+    'num_reposted': 'q',
+    'num_reply_to': 'q',
+    'reply_to_id': 'q',
+    'thread_id': 'q',
+    'conversation_id': 'q',
+    'created_at': 'q',
+    'updated_at': 'q',
+}
+
+
+def column_spec(fields, types):
+    paths = dict(fields)
+    return tuple((name, paths[name], typecode) for name, typecode in types.items())
+
+
+USER_COLUMNS = column_spec(USER_FIELDS, USER_COLUMN_TYPES)
+POST_COLUMNS = column_spec(POST_FIELDS, POST_COLUMN_TYPES)
+
+COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+_numpy = False
+
+
+def load_numpy():
+    # numpy takes a large share of import time, so look it up on first use
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+def new_column(typecode):
+    return [] if typecode == 'str' else array(typecode)
+
+
+def as_numbers(value):
+    return value if type(value) in (int, bool) else MISSING
+
+
+def is_number(value):
+    return type(value) in (int, bool)
+
+
+class Columns(object):
+
+    def __init__(self, spec, data=None, valid=None):
+        """
+
+        Columns
+        ---
+            ユーザーや投稿を列ごとにまとめて保持します。\n
+            数値の列は array (NumPyがあれば numpy() でコピーせずに参照可能)、
+            文字列の列は intern された文字列のリストとして持つため、
+            1件ごとにオブジェクトを作るより少ないメモリで大量の結果を扱えます。\n
+            数値の列で値が無い場合は MISSING (-1) が入り、
+            valid (列ごとの 0/1 の array) の同じ位置が 0 になります。
+            mask() と where() は値が無い行を条件に一致しないものとして扱います。
+
+        """
+        self.spec = spec
+        self.data = data if data is not None else {
+            name: new_column(typecode) for name, _, typecode in spec}
+        if valid is None:
+            valid = {name: array('B', b'\x01' * len(self.data[name]))
+                     for name, _, typecode in spec if typecode != 'str'}
+        self.valid = valid
+        self.getters = None
+
+    @classmethod
+    def from_items(cls, spec, items):
+        columns = cls(spec)
+        columns.extend(items)
+        return columns
+
+    def __len__(self):
+        return len(self.data[self.spec[0][0]]) if self.spec else 0
+
+    def __getitem__(self, name):
+        return self.data[name]
+
+    def __contains__(self, name):
+        return name in self.data
+
+    def __repr__(self):
+        return f'Columns(rows={len(self)}, columns={self.names})'
+
+    @property
+    def names(self):
+        return [name for name, _, _ in self.spec]
+
+    def extend(self, items):
+        """APIのレスポンスに含まれる dict のリストを各列の末尾に追加する"""
+        if self.getters is None:
+            self.getters = [
+                (self.data[name], self.valid.get(name), typecode,
+                 None if '.' in path or '[' in path else path, path_getter(path))
+                for name, path, typecode in self.spec]
+        intern = sys.intern
+        for column, valid, typecode, key, getter in self.getters:
+            if key is not None:
+                values = [item.get(key) for item in items]
+            else:
+                values = [getter(item) for item in items]
+            if typecode == 'str':
+                column.extend([intern(value) if type(value) is str else value
+                               for value in values])
+                continue
+            size = len(column)
+            try:
+                column.extend(values)
+            except (TypeError, OverflowError):
+                # nulls or unexpected types somewhere in the page
+                del column[size:]
+                column.extend([as_numbers(value) for value in values])
+                valid.extend([is_number(value) for value in values])
+            else:
+                valid.frombytes(b'\x01' * len(values))
+
+    def numpy(self, name):
+        """列を NumPy 配列として返す (数値の列はコピーせずに参照する)"""
+        np = load_numpy()
+        if np is None:
+            raise ImportError('numpy is required for Columns.numpy()')
+        column = self.data[name]
+        if not isinstance(column, array):
+            return np.array(column, dtype=object)
+        if not column:
+            return np.zeros(0, dtype=column.typecode)
+        return np.frombuffer(column, dtype=column.typecode)
+
+    def is_valid(self, name):
+        """値がある行を示すマスクを返す (mask() と同じ形式)"""
+        np = load_numpy()
+        column = self.data[name]
+        if not isinstance(column, array):
+            flags = [v is not None for v in column]
+            return np.array(flags, dtype=bool) if np is not None else flags
+        valid = self.valid[name]
+        if np is None:
+            return [bool(v) for v in valid]
+        if not valid:
+            return np.zeros(0, dtype=bool)
+        return np.frombuffer(valid, dtype=np.uint8).astype(bool)
+
+    def mask(self, name, op, value):
+        """
+        条件に一致する行を示すマスクを返す
+
+        op は '==', '!=', '<', '<=', '>', '>=', 'in' のいずれか。
+        値が無い行 (数値の列の MISSING、文字列の列の None) は、
+        どの条件にも一致しません ('!=' も含む)。
+        NumPyがあれば bool の ndarray (& や | で組み合わせ可能)、
+        無ければ bool のリストを返す
+        """
+        np = load_numpy()
+        column = self.data[name]
+        if op == 'in':
+            if np is not None and isinstance(column, array):
+                return np.isin(self.numpy(name), list(value)) & self.is_valid(name)
+            value = set(value)
+            matched = (v in value for v in column)
+        else:
+            compare = COMPARISONS[op]
+            if np is not None and isinstance(column, array):
+                return compare(self.numpy(name), value) & self.is_valid(name)
+            # None in a string column can't be ordered against a value
+            matched = (v is not None and compare(v, value) for v in column)
+        if isinstance(column, array):
+            valid = self.valid[name]
+        else:
+            valid = [v is not None for v in column]
+        if np is not None:
+            return np.fromiter((m and ok for m, ok in zip(matched, valid)),
+                               dtype=bool, count=len(column))
+        return [bool(m and ok) for m, ok in zip(matched, valid)]
+
+    def take(self, indices):
+        """indices の順に行を取り出した新しい Columns を返す"""
+        np = load_numpy()
+        data = {}
+        valid = {}
+        if np is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+            positions = None
+            for name, _, typecode in self.spec:
+                column = self.data[name]
+                if typecode == 'str':
+                    if positions is None:
+                        positions = indices.tolist()
+                    data[name] = list(map(column.__getitem__, positions))
+                else:
+                    data[name] = array(typecode, self.numpy(name)[indices].tobytes())
+                    valid[name] = array('B', self.is_valid(name)[indices].tobytes())
+        else:
+            indices = list(indices)
+            for name, _, typecode in self.spec:
+                column = self.data[name]
+                taken = list(map(column.__getitem__, indices))
+                if typecode == 'str':
+                    data[name] = taken
+                else:
+                    data[name] = array(typecode, taken)
+                    valid[name] = array('B', map(self.valid[name].__getitem__, indices))
+        return Columns(self.spec, data, valid)
+
+    def filter(self, mask):
+        """mask が真の行だけを残した新しい Columns を返す"""
+        np = load_numpy()
+        if np is not None:
+            return self.take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+        data = {}
+        valid = {}
+        for name, _, typecode in self.spec:
+            kept = list(compress(self.data[name], mask))
+            if typecode == 'str':
+                data[name] = kept
+            else:
+                data[name] = array(typecode, kept)
+                valid[name] = array('B', compress(self.valid[name], mask))
+        return Columns(self.spec, data, valid)
+
+    def where(self, name, op, value):
+        """Columns.filter(Columns.mask(name, op, value)) の省略形"""
+        return self.filter(self.mask(name, op, value))
+
+    def argsort(self, name, reverse=False):
+        np = load_numpy()
+        column = self.data[name]
+        if np is not None and isinstance(column, array):
+            order = np.argsort(self.numpy(name), kind='stable')
+            return order[::-1] if reverse else order
+        if isinstance(column, array):
+            return sorted(range(len(column)), key=column.__getitem__, reverse=reverse)
+        # None sorts first (last when reversed)
+        return sorted(range(len(column)),
+                      key=lambda i: (column[i] is not None, column[i] or ''),
+                      reverse=reverse)
+
+    def sort(self, name, reverse=False):
+        """name の列で並べ替えた新しい Columns を返す"""
+        return self.take(self.argsort(name, reverse))
+
+    def head(self, n=10):
+        return self.take(range(min(n, len(self))))
+
+    def rows(self):
+        """1行ずつ dict として返す (値が無い数値は None)"""
+        names = self.names
+        columns = [self.data[name] for name in names]
+        flags = [self.valid.get(name) for name in names]
+        for i, values in enumerate(zip(*columns)):
+            yield {name: value if valid is None or valid[i] else None
+                   for name, value, valid in zip(names, values, flags)}
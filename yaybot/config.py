@@ -25,6 +25,7 @@ class Endpoints:
     POST_v3 = API_URL + '/v3/posts'
 
     # api other
+    OAUTH_TOKEN = API_URL + '/api/v1/oauth/token'
     GET_TIMELINE = POST_v2 + '/timeline'
     GET_USER_TIMELINE = POST_v2 + '/user_timeline'
     GET_FOLLOWING_TIMELINE = POST_v2 + '/following_timeline'
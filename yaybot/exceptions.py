@@ -11,7 +11,11 @@ class ForbiddenError(YayError):
 
 
 class RateLimitError(YayError):
-    pass
+
+    def __init__(self, message=None, retry_after=None):
+        super().__init__(message)
+        # seconds the server asked us to wait (Retry-After), if any
+        self.retry_after = retry_after
 
 
 class ExceedCallQuotaError(YayError):
@@ -22,5 +26,9 @@ class InvalidSignedInfo(YayError):
     pass
 
 
+class ServerError(YayError):
+    pass
+
+
 class UnknownError(YayError):
     pass
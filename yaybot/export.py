@@ -0,0 +1,126 @@
+import gzip
+
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:
+    _orjson_dumps = None
+    import json
+
+
+def json_line(record) -> bytes:
+    if _orjson_dumps is not None:
+        return _orjson_dumps(record, default=str) + b'\n'
+    return (json.dumps(record, ensure_ascii=False, separators=(',', ':'),
+                       default=str) + '\n').encode('utf-8')
+
+
+def model_to_dict(obj) -> dict:
+    """__slots__ を持つモデルを dict に変換する (lazyモデルの '_raw' は除く)"""
+    data = {}
+    for cls in reversed(type(obj).__mro__):
+        for name in getattr(cls, '__slots__', ()):
+            if name != '_raw':
+                data[name] = getattr(obj, name, None)
+    return data
+
+
+def open_sink(path, compression=None, append=False, level=None):
+    """
+    書き込み用のファイルを開く
+
+    compression は None, 'gzip', 'zstd' のいずれか。
+    None の場合は拡張子 (.gz / .zst) から判断する
+    """
+    if compression is None:
+        if path.endswith('.gz'):
+            compression = 'gzip'
+        elif path.endswith('.zst'):
+            compression = 'zstd'
+    mode = 'ab' if append else 'wb'
+    if compression == 'gzip':
+        return gzip.open(path, mode, compresslevel=6 if level is None else level)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('zstandard is required for zstd compression')
+        cctx = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return zstandard.open(path, mode, cctx=cctx)
+    if compression is not None:
+        raise ValueError(f'unknown compression: {compression}')
+    return open(path, mode)
+
+
+class JSONLWriter(object):
+
+    def __init__(self, path, compression=None, append=False, level=None):
+        """
+
+        JSONLWriter
+        ---
+            レコードを1行ずつ JSON Lines 形式で書き込みます。\n
+            gzip / zstd で圧縮しながら書き込むこともできます。
+
+        """
+        self.path = path
+        self.file = open_sink(path, compression, append, level)
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, record):
+        if not isinstance(record, dict):
+            record = model_to_dict(record)
+        self.file.write(json_line(record))
+        self.count += 1
+
+    def write_many(self, records):
+        lines = [json_line(record if isinstance(record, dict) else model_to_dict(record))
+                 for record in records]
+        self.file.write(b''.join(lines))
+        self.count += len(lines)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def export(source, path, raw=True, compression=None, append=False, level=None):
+    """
+    取得した結果をページごとに JSON Lines 形式でファイルへ書き出す
+
+    Parameters:
+        source: Yay.iter_* が返す Paginator、または dict やモデルのイテラブル
+        path (str): 書き出すファイルのパス (.gz / .zst なら圧縮される)
+        raw (bool): Trueの場合はAPIのレスポンスをそのまま、
+            Falseの場合はモデルオブジェクトの属性を書き出します。
+        compression (str): 'gzip' または 'zstd' (任意)
+        append (bool): Trueにすると既存のファイルに追記します。
+            Paginator の resume=True と組み合わせて中断したエクスポートを再開できます。
+
+    Returns:
+        int: 書き出したレコードの数
+
+    Examples:
+        フォロワーを gzip 圧縮したファイルに書き出す場合
+    >>> export(yay.iter_followers('123'), 'followers.jsonl.gz')
+
+    """
+    with JSONLWriter(path, compression, append, level) as writer:
+        if hasattr(source, 'iter_raw_pages'):
+            pages = source.iter_raw_pages() if raw else source.iter_pages()
+            for page in pages:
+                # only one page is held in memory at a time
+                records = (page.get(source.key) or []) if raw else page
+                writer.write_many(records)
+                writer.flush()
+        else:
+            for record in source:
+                writer.write(record)
+        return writer.count
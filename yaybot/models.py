@@ -1,4 +1,61 @@
-class User:
+class LazyModel(object):
+
+    __slots__ = ()
+
+    # attribute name -> function(raw dict), filled in by utils.ObjectGenerator
+    _resolvers = {}
+
+    def __getattr__(self, name):
+        # only reached for slots that have not been set yet, i.e. on
+        # objects created from a raw dict by ObjectGenerator in lazy mode
+        resolver = type(self)._resolvers.get(name)
+        if resolver is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = resolver(self._raw)
+        setattr(self, name, value)
+        return value
+
+
+class User(LazyModel):
+
+    __slots__ = (
+        '_raw',
+        'id',
+        'screen_name',
+        'bio',
+        'badge',
+        'num_followers',
+        'num_followings',
+        'private_user',
+        'num_posts',
+        'num_joined_groups',
+        'num_reviews',
+        'verified_age',
+        'country_code',
+        'is_vip',
+        'hide_vip',
+        'online_status',
+        'prefecture',
+        'gender',
+        'generation',
+        'created_at',
+        'profile_image',
+        'profile_thumbnail',
+        'cover_image',
+        'cover_thumbnail',
+        'last_logged_in_at',
+        'mutual_chat_enabled',
+        'chat_request_enabled',
+        'chat_phone_verification_required',
+        'age_restricted_review',
+        'following_restricted_review',
+        'review_restricted_by',
+        'recently_banned',
+        'dangerous_user',
+        'new_user',
+        'selected_interests',
+    )
 
     def __init__(
         self,
@@ -78,6 +135,13 @@ class User:
 
 class GroupUser(User):
 
+    __slots__ = (
+        'moderator',
+        'banned',
+        'pending_transfer',
+        'pending_deputize',
+    )
+
     def __init__(
         self,
         moderator,
@@ -115,46 +179,83 @@ class GroupUser(User):
         selected_interests
     ):
         super().__init__(
-            id,
-            screen_name,
-            bio,
-            num_followers,
-            is_private,
-            num_posts,
-            num_joined_groups,
-            num_reviews,
-            verified_age,
-            country_code,
-            is_vip,
-            hide_vip,
-            online_status,
-            profile_image,
-            profile_thumbnail,
-            cover_image,
-            cover_thumbnail,
-            last_logged_in_at,
-            mutual_chat_enabled,
-            chat_request_enabled,
-            chat_phone_verification_required,
-            age_restricted_review,
-            following_restricted_review,
-            review_restricted_by,
-            recently_banned,
-            dangerous_user,
-            new_user,
-            selected_interests
+            id=id,
+            screen_name=screen_name,
+            bio=bio,
+            badge=badge,
+            num_followers=num_followers,
+            num_followings=None,
+            private_user=is_private,
+            num_posts=num_posts,
+            num_joined_groups=num_joined_groups,
+            num_reviews=num_reviews,
+            verified_age=verified_age,
+            country_code=country_code,
+            is_vip=is_vip,
+            hide_vip=hide_vip,
+            online_status=online_status,
+            prefecture=None,
+            gender=None,
+            generation=None,
+            created_at=None,
+            profile_image=profile_image,
+            profile_thumbnail=profile_thumbnail,
+            cover_image=cover_image,
+            cover_thumbnail=cover_thumbnail,
+            last_logged_in_at=last_logged_in_at,
+            mutual_chat_enabled=mutual_chat_enabled,
+            chat_request_enabled=chat_request_enabled,
+            chat_phone_verification_required=chat_phone_verification_required,
+            age_restricted_review=age_restricted_review,
+            following_restricted_review=following_restricted_review,
+            review_restricted_by=review_restricted_by,
+            recently_banned=recently_banned,
+            dangerous_user=dangerous_user,
+            new_user=new_user,
+            selected_interests=selected_interests
         )
         self.moderator = moderator
         self.banned = banned
         self.pending_transfer = pending_transfer
         self.pending_deputize = pending_deputize
-        self.badge = badge
 
     def __repr__(self):
         return f''
 
 
-class Post:
+class Post(LazyModel):
+
+    __slots__ = (
+        '_raw',
+        'id',
+        'author_id',
+        'author_screen_name',
+        'text',
+        'group_id',
+        'font_size',
+        'liked',
+        'num_likes',
+        'type',
+        'color',
+        'num_reposted',
+        'created_at',
+        'updated_at',
+        'edited_at',
+        'num_reported',
+        'reply_to_id',
+        'num_reply_to',
+        'repostable',
+        'highlighted',
+        'hidden',
+        'thread_id',
+        'message_tags',
+        'tag_type',
+        'mentioned_user_id',
+        'conversation_id',
+        'attachment',
+        'attachment_thumbnail',
+        'shared_url',
+    )
 
     def __init__(
         self,
@@ -222,6 +323,16 @@ class Post:
 
 class Review:
 
+    __slots__ = (
+        'text',
+        'created_at',
+        'id',
+        'mutual_review_enabled',
+        'num_reported',
+        'author_id',
+        'author_screen_name',
+    )
+
     def __init__(self, text, created_at, id, mutual_review_enabled,
                  num_reported, author_id, author_screen_name):
         self.text = text
@@ -236,7 +347,58 @@ class Review:
         return f'Review(author_screen_name={self.author_screen_name}, text={self.text})'
 
 
-class Group:
+class Group(LazyModel):
+
+    __slots__ = (
+        '_raw',
+        'members_can_post_image_and_video',
+        'members_can_post_url',
+        'ownership_transfer_allowed',
+        'allowed_thread_creators',
+        'call_timeline',
+        'cover_image',
+        'cover_thumbnail',
+        'description',
+        'gender',
+        'generation_groups_limit',
+        'category_id',
+        'num_groups_members',
+        'guidelines',
+        'conference_call_hidden',
+        'game_eight_hidden',
+        'reported_posts_hidden',
+        'num_highlighted',
+        'homepage',
+        'icon',
+        'id',
+        'invited_to_join',
+        'joined',
+        'pending',
+        'private_group',
+        'moderator_ids',
+        'mobile_verified_only',
+        'verified_age_only',
+        'owner_id',
+        'owner_screen_name',
+        'num_pendings',
+        'pending_deputize_ids',
+        'pending_transfer_id',
+        'place',
+        'num_posts',
+        'num_related_groups',
+        'safe_mode_enabled',
+        'hidden_grouop',
+        'seizable',
+        'seizable_before',
+        'sub_category_id',
+        'num_threads',
+        'category',
+        'group_name',
+        'num_unread_threads',
+        'updated_at',
+        'num_views',
+        'walkthrough_requested',
+    )
 
     def __init__(
         self,
@@ -342,6 +504,22 @@ class Group:
 
 class ChatRoom:
 
+    __slots__ = (
+        'background_image',
+        'background_thumbnail',
+        'icon',
+        'icon_thumbnail',
+        'id',
+        'is_group',
+        'is_request',
+        'last_message',
+        'member_ids',
+        'member_screen_names',
+        'chat_title',
+        'num_unread',
+        'updated_at',
+    )
+
     def __init__(
             self,
             background_image,
@@ -378,6 +556,25 @@ class ChatRoom:
 
 class Message:
 
+    __slots__ = (
+        'attachment',
+        'attachment_android',
+        'attachment_thumbnail',
+        'created_at',
+        'font_size',
+        'message_id',
+        'type',
+        'reacted',
+        'num_reactions',
+        'room_id',
+        'text',
+        'author_id',
+        'video_processed',
+        'video_thumbnail_big_url',
+        'video_thumbnail_url',
+        'video_url',
+    )
+
     def __init__(
             self,
             attachment,
@@ -420,6 +617,18 @@ class Message:
 
 class Activity:
 
+    __slots__ = (
+        'created_at',
+        'from_post_id',
+        'from_group_id',
+        'from_group_topic',
+        'metadata',
+        'type',
+        'from_user_id',
+        'from_user_screen_name',
+        'from_user_profile_thumbnail',
+    )
+
     def __init__(
             self,
             created_at,
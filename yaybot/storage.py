@@ -0,0 +1,263 @@
+import json
+import os
+import sqlite3
+import threading
+
+from .utils import (
+    compile_values,
+    USER_FIELDS,
+    POST_FIELDS,
+    GROUP_FIELDS,
+    REVIEW_FIELDS,
+    MESSAGE_FIELDS
+)
+
+
+# table -> (model field map, primary key column, extra columns)
+TABLES = {
+    'users': (USER_FIELDS, 'id', ()),
+    'posts': (POST_FIELDS, 'id', ()),
+    'groups': (GROUP_FIELDS, 'id', ()),
+    # user_id is the user the letter was written to
+    'reviews': (REVIEW_FIELDS, 'id', ('user_id',)),
+    'messages': (MESSAGE_FIELDS, 'message_id', ()),
+}
+
+# table -> (columns of the primary key)
+EDGES = {
+    'follows': ('follower_id', 'followee_id'),
+    'likes': ('user_id', 'post_id'),
+}
+
+
+def encode(value):
+    # lists and dicts (message_tags, moderator_ids, ...) are stored as json text
+    return json.dumps(value, ensure_ascii=False)
+
+
+class Table(object):
+
+    def __init__(self, name, fields, key, extra=()):
+        self.name = name
+        self.key = key
+        self.columns = [attr for attr, _ in fields] + list(extra)
+        self.fields = len(fields)
+        self.values = compile_values(fields)
+        self.key_index = self.columns.index(key)
+
+        others = [column for column in self.columns if column != key]
+        self.create_sql = (
+            f'CREATE TABLE IF NOT EXISTS {name} ('
+            f'{key} INTEGER PRIMARY KEY, {", ".join(others)})'
+        )
+        # a partial payload (e.g. the short user objects in likers) must not
+        # wipe columns that an earlier, complete payload filled in
+        self.upsert_sql = (
+            f'INSERT INTO {name} ({", ".join(self.columns)}) '
+            f'VALUES ({", ".join("?" * len(self.columns))}) '
+            f'ON CONFLICT({key}) DO UPDATE SET '
+            + ', '.join(f'{column} = COALESCE(excluded.{column}, {name}.{column})'
+                        for column in others)
+        )
+
+    def row(self, item, extra=()):
+        if isinstance(item, dict):
+            values = self.values(item)
+        else:
+            values = [getattr(item, column, None) for column in self.columns[:self.fields]]
+        values = [encode(value) if type(value) in (list, dict) else value
+                  for value in values]
+        values.extend(extra)
+        return values
+
+    def rows(self, items, extra=()):
+        rows = [self.row(item, extra) for item in items]
+        # without an id the row would silently get a new rowid
+        return [row for row in rows if row[self.key_index] is not None]
+
+
+class YayStorage(object):
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        """
+
+        YayStorage
+        ---
+            取得したユーザー・投稿・グループ・レター・メッセージと
+            フォロー・いいねの関係を正規化してSQLiteに保存します。\n
+            書き込みは executemany によるまとめてのupsertで、
+            1ページごとにひとつのトランザクションで行われます。
+
+        Parameters:
+            path (str): データベースファイルのパス
+            batch_size (int): save_* で1回のトランザクションに含める最大件数
+
+        Examples:
+            フォロワーとフォローの関係を保存する場合
+        >>> storage = YayStorage('crawl.sqlite3')
+        >>> storage.store_followers(yay.iter_followers('123'), '123')
+
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.tables = {
+            name: Table(name, fields, key, extra)
+            for name, (fields, key, extra) in TABLES.items()
+        }
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        # WAL keeps the file consistent with NORMAL, only the last commits
+        # can be lost on power failure
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        for table in self.tables.values():
+            self._conn.execute(table.create_sql)
+        for name, (first, second) in EDGES.items():
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {name} ('
+                f'{first} INTEGER NOT NULL, {second} INTEGER NOT NULL, '
+                f'PRIMARY KEY ({first}, {second})) WITHOUT ROWID'
+            )
+            self._conn.execute(
+                f'CREATE INDEX IF NOT EXISTS {name}_{second} ON {name} ({second})')
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write(self, rows=(), edges=()):
+        # rows: [(table, rows)], edges: [(edge table, pairs)], all in one transaction
+        with self._lock, self._conn:
+            for table, table_rows in rows:
+                if table_rows:
+                    self._conn.executemany(table.upsert_sql, table_rows)
+            for name, pairs in edges:
+                if pairs:
+                    first, second = EDGES[name]
+                    self._conn.executemany(
+                        f'INSERT OR IGNORE INTO {name} ({first}, {second}) VALUES (?, ?)', pairs)
+
+    def _save(self, name, items, extra=()):
+        table = self.tables[name]
+        items = list(items)
+        for start in range(0, len(items), self.batch_size):
+            self._write([(table, table.rows(items[start:start + self.batch_size], extra))])
+        return len(items)
+
+    # ====== MODELS / RAW DICTS ======
+
+    def save_users(self, users) -> int:
+        """User (GroupUserも可) またはAPIのユーザーのdictを保存する"""
+        return self._save('users', users)
+
+    def save_posts(self, posts) -> int:
+        return self._save('posts', posts)
+
+    def save_groups(self, groups) -> int:
+        return self._save('groups', groups)
+
+    def save_reviews(self, reviews, user_id=None) -> int:
+        return self._save('reviews', reviews, (user_id,))
+
+    def save_messages(self, messages) -> int:
+        return self._save('messages', messages)
+
+    def save_follows(self, pairs) -> int:
+        """(フォローしている側のID, フォローされている側のID) の組を保存する"""
+        pairs = list(pairs)
+        self._write(edges=[('follows', pairs)])
+        return len(pairs)
+
+    def save_likes(self, pairs) -> int:
+        """(ユーザーID, 投稿ID) の組を保存する"""
+        pairs = list(pairs)
+        self._write(edges=[('likes', pairs)])
+        return len(pairs)
+
+    # ====== PAGINATORS ======
+
+    def _store(self, paginator, build):
+        # one transaction per page, so a resume=True paginator never
+        # checkpoints past data that is not on disk yet
+        count = 0
+        for page in paginator.iter_raw_pages():
+            items = page.get(paginator.key) or []
+            self._write(*build(items))
+            count += len(items)
+        return count
+
+    def store_followers(self, paginator, user_id) -> int:
+        """Yay.iter_followers(user_id) の結果をユーザーとフォロー関係として保存する"""
+        users = self.tables['users']
+        user_id = int(user_id)
+        return self._store(paginator, lambda items: (
+            [(users, users.rows(items))],
+            [('follows', [(item['id'], user_id) for item in items if item.get('id') is not None])]
+        ))
+
+    def store_followings(self, paginator, user_id) -> int:
+        """Yay.iter_followings(user_id) の結果をユーザーとフォロー関係として保存する"""
+        users = self.tables['users']
+        user_id = int(user_id)
+        return self._store(paginator, lambda items: (
+            [(users, users.rows(items))],
+            [('follows', [(user_id, item['id']) for item in items if item.get('id') is not None])]
+        ))
+
+    def store_likers(self, paginator, post_id) -> int:
+        """Yay.iter_likers(post_id) の結果をユーザーといいねの関係として保存する"""
+        users = self.tables['users']
+        post_id = int(post_id)
+        return self._store(paginator, lambda items: (
+            [(users, users.rows(items))],
+            [('likes', [(item['id'], post_id) for item in items if item.get('id') is not None])]
+        ))
+
+    def store_hima_users(self, paginator) -> int:
+        users = self.tables['users']
+        return self._store(paginator, lambda items: (
+            [(users, users.rows([item.get('user') or {} for item in items]))], ()
+        ))
+
+    def store_timeline(self, paginator) -> int:
+        """Yay.iter_timeline() の投稿と投稿者を保存する"""
+        posts, users = self.tables['posts'], self.tables['users']
+        return self._store(paginator, lambda items: (
+            [(posts, posts.rows(items)),
+             (users, users.rows([item['user'] for item in items if item.get('user')]))], ()
+        ))
+
+    def store_letters(self, paginator, user_id) -> int:
+        """Yay.iter_letters(user_id) のレターを保存する"""
+        reviews = self.tables['reviews']
+        user_id = int(user_id)
+        return self._store(paginator, lambda items: (
+            [(reviews, reviews.rows(items, (user_id,)))], ()
+        ))
+
+    # ====== QUERIES ======
+
+    def count(self, table: str) -> int:
+        if table not in self.tables and table not in EDGES:
+            raise ValueError(f'unknown table: {table}')
+        with self._lock:
+            return self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def execute(self, sql: str, parameters=()):
+        """任意のSQLを実行して全ての行を返す"""
+        with self._lock:
+            return self._conn.execute(sql, parameters).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -1,4 +1,14 @@
-import huepy
+import email.utils
+import time
+
+# decode response bodies with the fastest parser available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
 
 from .exceptions import (
     YayError,
@@ -7,6 +17,7 @@ from .exceptions import (
     RateLimitError,
     ExceedCallQuotaError,
     InvalidSignedInfo,
+    ServerError,
     UnknownError
 )
 
@@ -28,9 +39,14 @@ def handle_response(resp):
     if resp.status_code == 403:
         raise ForbiddenError('Forbidden')
     if resp.status_code == 429:
-        raise RateLimitError('Rate limit exceeded')
+        raise RateLimitError(
+            'Rate limit exceeded',
+            parse_retry_after(resp.headers.get('Retry-After')))
+    if resp.status_code >= 500:
+        raise ServerError(f'Server error ({resp.status_code})')
 
-    resp_json = resp.json()
+    # parse the raw bytes once, callers get the decoded body back
+    resp_json = json_loads(resp.content)
 
     if 'error_code' in resp_json:
         if resp_json['error_code'] == -343:
@@ -38,286 +54,445 @@ def handle_response(resp):
         if resp_json['error_code'] == -380:
             raise InvalidSignedInfo('Invalid signed info')
 
+    return resp_json
+
+
+def parse_retry_after(value):
+    # Retry-After is either a number of seconds or an HTTP date
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+# ids sent per request by the plural endpoints; the server limit is not
+# documented, so stay conservative
+BATCH_SIZE = 50
+
+
+def chunks(items, size):
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def post_batches(self, url, param, ids, batch_size, cache_endpoint):
+    """
+    ids を batch_size 件ずつ url へ送信し、リクエストごとの結果のリストを返す
+
+    途中のリクエストで失敗した場合は、それまでの結果を completed、
+    完了したIDを completed_ids、完了が確認できなかったIDを failed_ids として
+    例外に付けてから送出する
+    """
+    ids = list(dict.fromkeys(ids))
+    results = []
+    completed_ids = []
+    for batch in chunks(ids, batch_size):
+        try:
+            resp = self._post(url, {param: batch})
+        except Exception as e:
+            # the failed batch may still have been applied in part
+            self._invalidate(cache_endpoint, *batch)
+            e.completed = results
+            e.completed_ids = completed_ids
+            e.failed_ids = ids[len(completed_ids):]
+            raise
+        results.append(resp)
+        completed_ids.extend(batch)
+        self._invalidate(cache_endpoint, *batch)
+    return results
+
 
 def console_print(text, color=None):
     text = '\n' + text
     if color is not None:
+        import huepy
         text = getattr(huepy, color)(text)
     print(text)
 
 
+def path_getter(path: str):
+    """'user.id' や 'message_tags[0].type' のようなパスから値を取り出す関数を返す
+    '[*]' はリストの各要素に残りのパスを適用する (例: 'members[*].id')
+    途中の値が存在しない場合は None を返す"""
+    steps = []
+    for part in path.split('.'):
+        name, _, index = part.partition('[')
+        if name:
+            steps.append(name)
+        if index:
+            index = index.rstrip(']')
+            steps.append(index if index == '*' else int(index))
+
+    def walk(data, steps):
+        for i, step in enumerate(steps):
+            if step == '*':
+                if not isinstance(data, list):
+                    return None
+                rest = steps[i + 1:]
+                return [walk(item, rest) for item in data]
+            try:
+                data = data[step]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return data
+
+    if '*' in steps:
+        return lambda data: walk(data, steps)
+
+    def getter(data):
+        for step in steps:
+            try:
+                data = data[step]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return data
+    return getter
+
+
+def field_code(fields, namespace):
+    """
+    (属性名, パス) の組から、値を取り出す式のソースコードを生成する
+
+    'key' は data.get('key')、'a.b' は a をひとつのローカル変数に
+    取り出してから .get('b')、'a[*].b' はリスト内包表記で読むコードになり、
+    それ以外のパスは path_getter を使う
+    """
+    lines = ['    get = data.get']
+    namespace['EMPTY'] = {}
+    parents = {}
+    exprs = []
+    for attr, path in fields:
+        head, dot, key = path.partition('.')
+        if not dot:
+            expr = f'get({path!r})'
+        elif head.endswith('[*]') and '[' not in key and '.' not in key:
+            parent = parents.get(head)
+            if parent is None:
+                parent = parents[head] = f'p{len(parents)}'
+                lines.append(
+                    f'    {parent} = get({head[:-3]!r})\n'
+                    f'    if not isinstance({parent}, list): {parent} = None')
+            expr = (f'[item.get({key!r}) if isinstance(item, dict) else None '
+                    f'for item in {parent}] if {parent} is not None else None')
+        elif '[' not in path and '.' not in key:
+            parent = parents.get(head)
+            if parent is None:
+                parent = parents[head] = f'p{len(parents)}'
+                lines.append(
+                    f'    {parent} = get({head!r})\n'
+                    f'    if not isinstance({parent}, dict): {parent} = EMPTY')
+            expr = f'{parent}.get({key!r})'
+        else:
+            name = f'g_{attr}'
+            namespace[name] = path_getter(path)
+            expr = f'{name}(data)'
+        exprs.append(expr)
+    return lines, exprs
+
+
+def compile_fields(cls, fields):
+    """dict をモデルに変換する関数を生成する (__init__ は通さずに __slots__ へ直接代入する)"""
+    namespace = {'new': cls.__new__, 'cls': cls}
+    lines, exprs = field_code(fields, namespace)
+    source = ['def convert(data):'] + lines + ['    obj = new(cls)']
+    source += [f'    obj.{attr} = {expr}' for (attr, _), expr in zip(fields, exprs)]
+    source.append('    return obj')
+    exec('\n'.join(source), namespace)
+    return namespace['convert']
+
+
+def compile_values(fields):
+    """dict から fields の順に値のリストを取り出す関数を生成する"""
+    namespace = {}
+    lines, exprs = field_code(fields, namespace)
+    source = ['def values(data):'] + lines + [f'    return [{", ".join(exprs)}]']
+    exec('\n'.join(source), namespace)
+    return namespace['values']
+
+
+# attribute name -> path in the api payload
+
+USER_FIELDS = (
+    ('id', 'id'),
+    ('screen_name', 'nickname'),
+    ('bio', 'biography'),
+    ('badge', 'title'),
+    ('num_followers', 'followers_count'),
+    ('num_followings', 'followings_count'),
+    ('private_user', 'is_private'),
+    ('num_posts', 'posts_count'),
+    ('num_joined_groups', 'groups_users_count'),
+    ('num_reviews', 'reviews_count'),
+    ('verified_age', 'age_verified'),
+    ('country_code', 'country_code'),
+    ('is_vip', 'vip'),
+    ('hide_vip', 'hide_vip'),
+    ('online_status', 'online_status'),
+    ('prefecture', 'prefecture'),
+    ('gender', 'gender'),
+    ('generation', 'generation'),
+    ('created_at', 'created_at'),
+    ('profile_image', 'profile_icon'),
+    ('profile_thumbnail', 'profile_icon_thumbnail'),
+    ('cover_image', 'cover_image'),
+    ('cover_thumbnail', 'cover_image_thumbnail'),
+    ('last_logged_in_at', 'last_loggedin_at'),
+    ('mutual_chat_enabled', 'mutual_chat'),
+    ('chat_request_enabled', 'chat_request'),
+    ('chat_phone_verification_required', 'chat_required_phone_verification'),
+    ('age_restricted_review', 'age_restricted_on_review'),
+    ('following_restricted_review', 'following_restricted_on_review'),
+    ('review_restricted_by', 'restricted_review_by'),
+    ('recently_banned', 'recently_kenta'),
+    ('dangerous_user', 'dangerous_user'),
+    ('new_user', 'new_user'),
+    ('selected_interests', 'interests_selected'),
+)
+
+GROUP_USER_FIELDS = (
+    ('moderator', 'is_moderator'),
+    ('banned', 'banned'),
+    ('pending_transfer', 'pending_transfer'),
+    ('pending_deputize', 'pending_deputize'),
+    ('badge', 'title'),
+) + tuple((attr, 'user.' + path) for attr, path in USER_FIELDS if attr != 'badge')
+
+POST_FIELDS = (
+    ('id', 'id'),
+    ('author_id', 'user.id'),
+    ('author_screen_name', 'user.nickname'),
+    ('text', 'text'),
+    ('group_id', 'group_id'),
+    ('font_size', 'font_size'),
+    ('liked', 'liked'),
+    ('num_likes', 'likes_count'),
+    ('type', 'post_type'),
+    ('color', 'color'),
+    ('num_reposted', 'reposts_count'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+    ('edited_at', 'edited_at'),
+    ('num_reported', 'reported_count'),
+    ('reply_to_id', 'in_reply_to'),
+    ('num_reply_to', 'in_reply_to_post_count'),
+    ('repostable', 'repostable'),
+    ('highlighted', 'highlighted'),
+    ('hidden', 'hidden'),
+    ('thread_id', 'thread_id'),
+    ('message_tags', 'message_tags'),
+    ('tag_type', 'message_tags[0].type'),
+    ('mentioned_user_id', 'message_tags[0].user_id'),
+    ('conversation_id', 'conversation_id'),
+    ('attachment', 'attachment'),
+    ('attachment_thumbnail', 'attachment_thumbnail'),
+    ('shared_url', 'shared_url.url'),
+)
+
+REVIEW_FIELDS = (
+    ('text', 'comment'),
+    ('created_at', 'created_at'),
+    ('id', 'id'),
+    ('mutual_review_enabled', 'mutual_review'),
+    ('num_reported', 'reported_count'),
+    ('author_id', 'reviewer.id'),
+    ('author_screen_name', 'reviewer.nickname'),
+)
+
+GROUP_FIELDS = (
+    ('members_can_post_image_and_video', 'allow_members_to_post_image_and_video'),
+    ('members_can_post_url', 'allow_members_to_post_url'),
+    ('ownership_transfer_allowed', 'allow_ownership_transfer'),
+    ('allowed_thread_creators', 'allow_thread_creation_by'),
+    ('call_timeline', 'call_timeline_display'),
+    ('cover_image', 'cover_image'),
+    ('cover_thumbnail', 'cover_image_thumbnail'),
+    ('description', 'description'),
+    ('gender', 'gender'),
+    ('generation_groups_limit', 'generation_groups_limit'),
+    ('category_id', 'group_category_id'),
+    ('icon', 'group_icon'),
+    ('num_groups_members', 'groups_users_count'),
+    ('guidelines', 'guidelines'),
+    ('conference_call_hidden', 'hide_conference_call'),
+    ('game_eight_hidden', 'hide_from_game_eight'),
+    ('reported_posts_hidden', 'hide_reported_posts'),
+    ('num_highlighted', 'highlighted_count'),
+    ('homepage', 'homepage'),
+    ('id', 'group_id'),
+    ('invited_to_join', 'invited_to_join'),
+    ('joined', 'is_joined'),
+    ('pending', 'is_pending'),
+    ('private_group', 'is_private'),
+    ('moderator_ids', 'moderator_ids'),
+    ('mobile_verified_only', 'only_mobile_verified'),
+    ('verified_age_only', 'only_verified_age'),
+    ('owner_id', 'user_id'),
+    ('owner_screen_name', 'owner.nickname'),
+    ('num_pendings', 'pending_count'),
+    ('pending_deputize_ids', 'pending_deputize_ids'),
+    ('pending_transfer_id', 'pending_transfer_id'),
+    ('place', 'place'),
+    ('num_posts', 'posts_count'),
+    ('num_related_groups', 'related_count'),
+    ('safe_mode_enabled', 'safe_mode'),
+    ('hidden_grouop', 'secret'),
+    ('seizable', 'seizable'),
+    ('seizable_before', 'seizable_before'),
+    ('sub_category_id', 'sub_category_id'),
+    ('num_threads', 'threads_count'),
+    ('category', 'title'),
+    ('group_name', 'topic'),
+    ('num_unread_threads', 'unread_threads_count'),
+    ('updated_at', 'updated_at'),
+    ('num_views', 'views_count'),
+    ('walkthrough_requested', 'walkthrough_requested'),
+)
+
+CHAT_ROOM_FIELDS = (
+    ('background_image', 'background'),
+    ('background_thumbnail', 'background_thumbnail'),
+    ('icon', 'icon'),
+    ('icon_thumbnail', 'icon_thumbnail'),
+    ('id', 'id'),
+    ('is_group', 'is_group'),
+    ('is_request', 'is_request'),
+    ('last_message', 'last_message.text'),
+    ('member_ids', 'members[*].id'),
+    ('member_screen_names', 'members[*].nickname'),
+    ('chat_title', 'name'),
+    ('num_unread', 'unread_count'),
+    ('updated_at', 'updated_at'),
+)
+
+MESSAGE_FIELDS = (
+    ('attachment', 'attachment'),
+    ('attachment_android', 'attachment_android'),
+    ('attachment_thumbnail', 'attachment_thumbnail'),
+    ('created_at', 'created_at'),
+    ('font_size', 'font_size'),
+    ('message_id', 'id'),
+    ('type', 'message_type'),
+    ('reacted', 'reacted'),
+    ('num_reactions', 'reactions_count'),
+    ('room_id', 'room_id'),
+    ('text', 'text'),
+    ('author_id', 'user_id'),
+    ('video_processed', 'video_processed'),
+    ('video_thumbnail_big_url', 'video_thumbnail_big_url'),
+    ('video_thumbnail_url', 'video_thumbnail_url'),
+    ('video_url', 'video_url'),
+)
+
+ACTIVITY_FIELDS = (
+    ('created_at', 'created_at'),
+    ('from_post_id', 'from_post.id'),
+    ('from_group_id', 'group.id'),
+    ('from_group_topic', 'group.topic'),
+    ('metadata', 'metadata'),
+    ('type', 'type'),
+    ('from_user_id', 'user.id'),
+    ('from_user_screen_name', 'user.nickname'),
+    ('from_user_profile_thumbnail', 'user.from_user_profile_icon_thumbnail'),
+)
+
+
+to_user = compile_fields(User, USER_FIELDS)
+to_group_user = compile_fields(GroupUser, GROUP_USER_FIELDS)
+to_post = compile_fields(Post, POST_FIELDS)
+to_review = compile_fields(Review, REVIEW_FIELDS)
+to_group = compile_fields(Group, GROUP_FIELDS)
+to_chat_room = compile_fields(ChatRoom, CHAT_ROOM_FIELDS)
+to_message = compile_fields(Message, MESSAGE_FIELDS)
+to_activity = compile_fields(Activity, ACTIVITY_FIELDS)
+
+User._resolvers = {attr: path_getter(path) for attr, path in USER_FIELDS}
+Post._resolvers = {attr: path_getter(path) for attr, path in POST_FIELDS}
+Group._resolvers = {attr: path_getter(path) for attr, path in GROUP_FIELDS}
+
+
+def lazy_object(cls, data: dict):
+    """フィールドの変換をアクセス時まで遅らせたオブジェクトを生成する"""
+    obj = cls.__new__(cls)
+    obj._raw = data
+    return obj
+
+
+def lazy_objects(cls, items: list):
+    new = cls.__new__
+    objs = []
+    for data in items:
+        obj = new(cls)
+        obj._raw = data
+        objs.append(obj)
+    return objs
+
+
 class ObjectGenerator(object):
 
     def user_object(self, user_data: dict) -> User:
-        def get_val(key):
-            return user_data.get(key, None)
-
-        user = User(
-            id=get_val('id'),
-            screen_name=get_val('nickname'),
-            bio=get_val('biography'),
-            badge=user_data.get('title', None),
-            num_followers=get_val('followers_count'),
-            num_followings=get_val('followings_count'),
-            private_user=get_val('is_private'),
-            num_posts=get_val('posts_count'),
-            num_joined_groups=get_val('groups_users_count'),
-            num_reviews=get_val('reviews_count'),
-            verified_age=get_val('age_verified'),
-            country_code=get_val('country_code'),
-            is_vip=get_val('vip'),
-            hide_vip=get_val('hide_vip'),
-            online_status=get_val('online_status'),
-            prefecture=get_val('prefecture'),
-            gender=get_val('gender'),
-            generation=get_val('generation'),
-            created_at=get_val('created_at'),
-            profile_image=get_val('profile_icon'),
-            profile_thumbnail=get_val(
-                'profile_icon_thumbnail'),
-            cover_image=get_val('cover_image'),
-            cover_thumbnail=get_val('cover_image_thumbnail'),
-            last_logged_in_at=get_val('last_loggedin_at'),
-            mutual_chat_enabled=get_val('mutual_chat'),
-            chat_request_enabled=get_val('chat_request'),
-            chat_phone_verification_required=get_val(
-                'chat_required_phone_verification'),
-            age_restricted_review=get_val(
-                'age_restricted_on_review'),
-            following_restricted_review=get_val(
-                'following_restricted_on_review'),
-            review_restricted_by=get_val('restricted_review_by'),
-            recently_banned=get_val('recently_kenta'),
-            dangerous_user=get_val('dangerous_user'),
-            new_user=get_val('new_user'),
-            selected_interests=get_val('interests_selected')
-        )
-        return user
+        if getattr(self, 'lazy_models', False):
+            return lazy_object(User, user_data)
+        return to_user(user_data)
+
+    def user_objects(self, users_data: list) -> list:
+        if getattr(self, 'lazy_models', False):
+            return lazy_objects(User, users_data)
+        return list(map(to_user, users_data))
 
     def group_user_object(self, user_data: dict) -> GroupUser:
-        def get_val(key):
-            return user_data['user'].get(key, None)
-
-        group_user = GroupUser(
-            moderator=user_data.get('is_moderator', None),
-            banned=user_data.get('banned', None),
-            pending_transfer=user_data.get('pending_transfer', None),
-            pending_deputize=user_data.get('pending_deputize', None),
-            badge=user_data.get('title', None),
-            id=get_val('id'),
-            screen_name=get_val('nickname'),
-            bio=get_val('biography'),
-            num_followers=get_val('followers_count'),
-            is_private=get_val('is_private'),
-            num_posts=get_val('posts_count'),
-            num_joined_groups=get_val('groups_users_count'),
-            num_reviews=get_val('reviews_count'),
-            verified_age=get_val('age_verified'),
-            country_code=get_val('country_code'),
-            is_vip=get_val('vip'),
-            hide_vip=get_val('hide_vip'),
-            online_status=get_val('online_status'),
-            profile_image=get_val('profile_icon'),
-            profile_thumbnail=get_val(
-                'profile_icon_thumbnail'),
-            cover_image=get_val('cover_image'),
-            cover_thumbnail=get_val('cover_image_thumbnail'),
-            last_logged_in_at=get_val('last_loggedin_at'),
-            mutual_chat_enabled=get_val('mutual_chat'),
-            chat_request_enabled=get_val('chat_request'),
-            chat_phone_verification_required=get_val(
-                'chat_required_phone_verification'),
-            age_restricted_review=get_val(
-                'age_restricted_on_review'),
-            following_restricted_review=get_val(
-                'following_restricted_on_review'),
-            review_restricted_by=get_val('restricted_review_by'),
-            recently_banned=get_val('recently_kenta'),
-            dangerous_user=get_val('dangerous_user'),
-            new_user=get_val('new_user'),
-            selected_interests=get_val('interests_selected')
-        )
-        return group_user
+        return to_group_user(user_data)
+
+    def group_user_objects(self, users_data: list) -> list:
+        return list(map(to_group_user, users_data))
 
     def post_object(self, post_data: dict) -> Post:
-        def get_val(key):
-            return post_data.get(key, None)
-
-        post = Post(
-            id=get_val('id'),
-            author_id=post_data['user'].get('id', None),
-            author_screen_name=post_data['user'].get('nickname', None),
-            text=get_val('text'),
-            group_id=get_val('group_id'),
-            font_size=get_val('font_size'),
-            liked=get_val('liked'),
-            num_likes=get_val('likes_count'),
-            type=get_val('post_type'),
-            color=get_val('color'),
-            num_reposted=get_val('reposts_count'),
-            created_at=get_val('created_at'),
-            updated_at=get_val('updated_at'),
-            edited_at=get_val('edited_at'),
-            num_reported=get_val('reported_count'),
-            reply_to_id=get_val('in_reply_to'),
-            num_reply_to=get_val(
-                'in_reply_to_post_count'),
-            repostable=get_val('repostable'),
-            highlighted=get_val('highlighted'),
-            hidden=get_val('hidden'),
-            thread_id=get_val('thread_id'),
-            message_tags=get_val('message_tags'),
-            tag_type=post_data['message_tags'][0].get(
-                'type') if post_data.get('message_tags') else None,
-            mentioned_user_id=post_data['message_tags'][0].get(
-                'user_id') if post_data.get('message_tags') else None,
-            conversation_id=get_val('conversation_id'),
-            attachment=get_val('attachment'),
-            attachment_thumbnail=get_val('attachment_thumbnail'),
-            shared_url=post_data.get('shared_url', {}).get('url', None)
-        )
-        return post
+        if getattr(self, 'lazy_models', False):
+            return lazy_object(Post, post_data)
+        return to_post(post_data)
 
-    def review_object(self, review_data: dict) -> Review:
-        def get_val(key):
-            return review_data.get(key, None)
+    def post_objects(self, posts_data: list) -> list:
+        if getattr(self, 'lazy_models', False):
+            return lazy_objects(Post, posts_data)
+        return list(map(to_post, posts_data))
 
-        review = Review(
-            text=get_val('comment'),
-            created_at=get_val('created_at'),
-            id=get_val('id'),
-            mutual_review_enabled=get_val('mutual_review'),
-            num_reported=get_val('reported_count'),
-            author_id=review_data['reviewer'].get('id', None),
-            author_screen_name=review_data['reviewer'].get('nickname', None),
-        )
+    def review_object(self, review_data: dict) -> Review:
+        return to_review(review_data)
 
-        return review
+    def review_objects(self, reviews_data: list) -> list:
+        return list(map(to_review, reviews_data))
 
     def group_object(self, group_data: dict) -> Group:
-        def get_val(key):
-            return group_data.get(key, None)
-
-        group = Group(
-            members_can_post_image_and_video=get_val(
-                'allow_members_to_post_image_and_video'),
-            members_can_post_url=get_val('allow_members_to_post_url'),
-            ownership_transfer_allowed=get_val('allow_ownership_transfer'),
-            allowed_thread_creators=get_val('allow_thread_creation_by'),
-            call_timeline=get_val('call_timeline_display'),
-            cover_image=get_val('cover_image'),
-            cover_thumbnail=get_val('cover_image_thumbnail'),
-            description=get_val('description'),
-            gender=get_val('gender'),
-            generation_groups_limit=get_val('generation_groups_limit'),
-            category_id=get_val('group_category_id'),
-            icon=get_val('group_icon'),
-            num_groups_members=get_val('groups_users_count'),
-            guidelines=get_val('guidelines'),
-            conference_call_hidden=get_val('hide_conference_call'),
-            game_eight_hidden=get_val('hide_from_game_eight'),
-            reported_posts_hidden=get_val('hide_reported_posts'),
-            num_highlighted=get_val('highlighted_count'),
-            homepage=get_val('homepage'),
-            id=get_val('group_id'),
-            invited_to_join=get_val('invited_to_join'),
-            joined=get_val('is_joined'),
-            pending=get_val('is_pending'),
-            private_group=get_val('is_private'),
-            moderator_ids=get_val('moderator_ids'),
-            mobile_verified_only=get_val('only_mobile_verified'),
-            verified_age_only=get_val('only_verified_age'),
-            owner_id=get_val('user_id'),
-            owner_screen_name=group_data['owner'].get('nickname', None),
-            num_pendings=get_val('pending_count'),
-            pending_deputize_ids=get_val('pending_deputize_ids'),
-            pending_transfer_id=get_val('pending_transfer_id'),
-            place=get_val('place'),
-            num_posts=get_val('posts_count'),
-            num_related_groups=get_val('related_count'),
-            safe_mode_enabled=get_val('safe_mode'),
-            hidden_grouop=get_val('secret'),
-            seizable=get_val('seizable'),
-            seizable_before=get_val('seizable_before'),
-            sub_category_id=get_val('sub_category_id'),
-            num_threads=get_val('threads_count'),
-            category=get_val('title'),
-            group_name=get_val('topic'),
-            num_unread_threads=get_val('unread_threads_count'),
-            updated_at=get_val('updated_at'),
-            num_views=get_val('views_count'),
-            walkthrough_requested=get_val('walkthrough_requested'),
-        )
-
-        return group
+        if getattr(self, 'lazy_models', False):
+            return lazy_object(Group, group_data)
+        return to_group(group_data)
+
+    def group_objects(self, groups_data: list) -> list:
+        if getattr(self, 'lazy_models', False):
+            return lazy_objects(Group, groups_data)
+        return list(map(to_group, groups_data))
 
     def chat_room_object(self, chat_room_data: dict) -> ChatRoom:
-        def get_val(key):
-            return chat_room_data.get(key, None)
-
-        chat_room = ChatRoom(
-            background_image=get_val('background'),
-            background_thumbnail=get_val('background_thumbnail'),
-            icon=get_val('icon'),
-            icon_thumbnail=get_val('icon_thumbnail'),
-            id=get_val('id'),
-            is_group=get_val('is_group'),
-            is_request=get_val('is_request'),
-            last_message=chat_room_data['last_message'].get('text', None),
-            member_ids=[member.get('id', None)
-                        for member in chat_room_data['members']],
-            member_screen_names=[member.get(
-                'nickname', None) for member in chat_room_data['members']],
-            chat_title=get_val('name'),
-            num_unread=get_val('unread_count'),
-            updated_at=get_val('updated_at')
-        )
-
-        return chat_room
+        return to_chat_room(chat_room_data)
+
+    def chat_room_objects(self, chat_rooms_data: list) -> list:
+        return list(map(to_chat_room, chat_rooms_data))
 
     def message_object(self, message_data: dict) -> Message:
-        def get_val(key):
-            return message_data.get(key, None)
-
-        message = Message(
-            attachment=get_val('attachment'),
-            attachment_android=get_val('attachment_android'),
-            attachment_thumbnail=get_val('attachment_thumbnail'),
-            created_at=get_val('created_at'),
-            font_size=get_val('font_size'),
-            message_id=get_val('id'),
-            type=get_val('message_type'),
-            reacted=get_val('reacted'),
-            num_reactions=get_val('reactions_count'),
-            room_id=get_val('room_id'),
-            text=get_val('text'),
-            author_id=get_val('user_id'),
-            video_processed=get_val('video_processed'),
-            video_thumbnail_big_url=get_val('video_thumbnail_big_url'),
-            video_thumbnail_url=get_val('video_thumbnail_url'),
-            video_url=get_val('video_url')
-        )
-
-        return message
+        return to_message(message_data)
+
+    def message_objects(self, messages_data: list) -> list:
+        return list(map(to_message, messages_data))
 
     def activity_object(self, activity_data: dict) -> Activity:
-        def get_val(key):
-            return activity_data.get(key, None)
-
-        def get_val_2(key, sub_key):
-            return activity_data.get(key, {}).get(sub_key, None)
-
-        activity = Activity(
-            created_at=get_val('created_at'),
-            from_post_id=get_val_2('from_post', 'id'),
-            from_group_id=get_val_2('group', 'id'),
-            from_group_topic=get_val_2('group', 'topic'),
-            metadata=get_val('metadata'),
-            type=get_val('type'),
-            from_user_id=get_val_2('user', 'id'),
-            from_user_screen_name=get_val_2('user', 'nickname'),
-            from_user_profile_thumbnail=get_val_2(
-                'user', 'from_user_profile_icon_thumbnail')
-        )
-
-        return activity
+        return to_activity(activity_data)
+
+    def activity_objects(self, activities_data: list) -> list:
+        return list(map(to_activity, activities_data))